@@ -119,9 +119,9 @@ def _build_context(
     other_needs = {}
     for slot, occupant in my.roster.items():
         if occupant is None:
-            base = my.slot_types.get(slot, slot.rstrip("0123456789"))
+            base = my.slot_base(slot)
             if base not in other_needs:
-                remaining = state.get_remaining_players(base)[:3]
+                remaining = state.get_remaining_players(base, top_n=3)
                 other_needs[base] = [
                     {"name": p.projection.player_name, "fmv": round(p.projection.baseline_aav * state.get_inflation_factor(), 1)}
                     for p in remaining
@@ -130,7 +130,7 @@ def _build_context(
     # Roster composition summary
     filled_positions = {}
     for slot, occupant in my.roster.items():
-        base = my.slot_types.get(slot, slot.rstrip("0123456789")) if slot else slot
+        base = my.slot_base(slot) if slot else slot
         if base not in filled_positions:
             filled_positions[base] = {"filled": 0, "total": 0}
         filled_positions[base]["total"] += 1
@@ -3,6 +3,7 @@ Application settings loaded from .env file via pydantic-settings.
 Supports multiple sports (football, basketball) via SPORT_PROFILES.
 """
 
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic_settings import BaseSettings
@@ -111,6 +112,43 @@ _FOOTBALL_ROSTER_DEFAULT = "QB,RB,RB,WR,WR,TE,FLEX,FLEX,K,DEF"
 _FOOTBALL_ELIGIBILITY = SPORT_PROFILES["football"]["slot_eligibility"]
 
 
+@lru_cache(maxsize=16)
+def parse_team_aliases(my_team_name: str) -> frozenset[str]:
+    """Lowercased aliases from a comma-separated MY_TEAM_NAME (cached per string)."""
+    return frozenset(a.strip().lower() for a in my_team_name.split(","))
+
+
+@lru_cache(maxsize=16)
+def _parse_roster_slots(roster_slots: str) -> tuple[str, ...]:
+    """Parse the comma-separated roster_slots string into labeled slot names.
+    Duplicates get numbered: RB -> RB1, RB2. Single slots stay as-is: QB, TE.
+    Cached per string — roster_size and slot_base_type read it on every update."""
+    raw = [s.strip().upper() for s in roster_slots.split(",") if s.strip()]
+    counts: dict[str, int] = {}
+    labeled: list[str] = []
+    # Count occurrences first
+    for slot in raw:
+        counts[slot] = counts.get(slot, 0) + 1
+    # Now label
+    seen: dict[str, int] = {}
+    for slot in raw:
+        seen[slot] = seen.get(slot, 0) + 1
+        if counts[slot] > 1:
+            labeled.append(f"{slot}{seen[slot]}")
+        else:
+            labeled.append(slot)
+    return tuple(labeled)
+
+
+@lru_cache(maxsize=16)
+def _slot_base_types(roster_slots: str) -> dict[str, str]:
+    """Labeled slot -> base type (trailing digits stripped), cached per roster string."""
+    return {
+        label: label.rstrip("0123456789")
+        for label in _parse_roster_slots(roster_slots)
+    }
+
+
 class Settings(BaseSettings):
     # Platform selection: "espn" or "sleeper"
     platform: str = "sleeper"
@@ -160,6 +198,7 @@ class Settings(BaseSettings):
     gemini_model: str = "gemini-2.5-flash"
     claude_model: str = "claude-haiku-4-5-20251001"
     ai_timeout_ms: int = 8000
+    max_ai_concurrency: int = 4
 
     # VORP replacement-level ranks per position — football
     vorp_baseline_qb: int = 11
@@ -259,35 +298,22 @@ class Settings(BaseSettings):
     def parsed_roster_slots(self) -> list[str]:
         """Parse the comma-separated roster_slots string into a list of labeled slot names.
         Duplicates get numbered: RB -> RB1, RB2. Single slots stay as-is: QB, TE."""
-        raw = [s.strip().upper() for s in self.roster_slots.split(",") if s.strip()]
-        counts: dict[str, int] = {}
-        labeled: list[str] = []
-        # Count occurrences first
-        for slot in raw:
-            counts[slot] = counts.get(slot, 0) + 1
-        # Now label
-        seen: dict[str, int] = {}
-        for slot in raw:
-            seen[slot] = seen.get(slot, 0) + 1
-            if counts[slot] > 1:
-                labeled.append(f"{slot}{seen[slot]}")
-            else:
-                labeled.append(slot)
-        return labeled
+        return list(_parse_roster_slots(self.roster_slots))
+
+    @property
+    def my_team_aliases(self) -> frozenset[str]:
+        """Lowercased MY_TEAM_NAME aliases. Follows runtime edits to my_team_name."""
+        return parse_team_aliases(self.my_team_name)
 
     @property
     def roster_size(self) -> int:
-        return len(self.parsed_roster_slots)
+        return len(_parse_roster_slots(self.roster_slots))
 
     @property
     def slot_base_type(self) -> dict[str, str]:
         """Map labeled slot names back to their base type. E.g. 'RB2' -> 'RB', 'FLEX1' -> 'FLEX'."""
-        result = {}
-        for label in self.parsed_roster_slots:
-            # Strip trailing digits to get base type
-            base = label.rstrip("0123456789")
-            result[label] = base
-        return result
+        # Copy: callers hold on to (and may edit) the returned map
+        return dict(_slot_base_types(self.roster_slots))
 
     @property
     def vorp_baselines(self) -> dict[str, int]:
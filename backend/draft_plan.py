@@ -79,7 +79,7 @@ def build_draft_plan_prompt(state: "DraftState") -> str:
     # Top 5 remaining per needed position — include projected points prominently
     position_pools = {}
     for pos, count in open_slots.items():
-        remaining = state.get_remaining_players(pos)[:5]
+        remaining = state.get_remaining_players(pos, top_n=5)
         pool = []
         for ps in remaining:
             fmv = calculate_fmv(ps, state)
@@ -209,7 +209,7 @@ def _fallback_plan(state: "DraftState") -> dict:
     for pos, count in open_slots.items():
         if pos not in spending_by_pos:
             # Estimate budget from remaining players at this position
-            remaining = state.get_remaining_players(pos)[:count]
+            remaining = state.get_remaining_players(pos, top_n=count)
             est_budget = sum(calculate_fmv(p, state) for p in remaining)
             top_tier = remaining[0].projection.tier if remaining else 3
             spending_by_pos[pos] = {"budget": round(est_budget), "count": count, "top_tier": top_tier}
@@ -21,11 +21,15 @@ def calculate_vona(player: PlayerState, state: DraftState) -> tuple[float, str |
     Returns (vona_value, next_player_name).
     """
     pos = player.projection.position.value
-    remaining = state.get_remaining_players(pos)  # sorted by VORP desc
+    name = player.projection.player_name
 
+    # Walk the VORP-sorted position index in place and stop at the first
+    # undrafted player after this one, instead of materializing the list
     found = False
-    for ps in remaining:
-        if ps.projection.player_name == player.projection.player_name:
+    for ps in state.get_position_players(pos):
+        if ps.is_drafted:
+            continue
+        if ps.projection.player_name == name:
             found = True
             continue
         if found:
@@ -68,14 +72,23 @@ def get_positional_vona_summary(state: DraftState) -> list[dict]:
     return results
 
 
+def _inflated_value(baseline_aav: float, inflation: float) -> float:
+    """FMV = BaselineAAV * inflation_factor, to one decimal."""
+    return round(baseline_aav * inflation, 1)
+
+
 def calculate_fmv(player: PlayerState, state: DraftState) -> float:
     """
     Fair Market Value adjusted by live inflation.
     FMV = BaselineAAV * inflation_factor
     """
-    base = player.projection.baseline_aav
+    return _inflated_value(player.projection.baseline_aav, state.get_inflation_factor())
+
+
+def calculate_fmv_batch(players: list[PlayerState], state: DraftState) -> list[float]:
+    """calculate_fmv for many players at once, reading inflation a single time."""
     inflation = state.get_inflation_factor()
-    return round(base * inflation, 1)
+    return [_inflated_value(p.projection.baseline_aav, inflation) for p in players]
 
 
 def calculate_inflation(state: DraftState) -> float:
@@ -96,9 +109,7 @@ def calculate_scarcity_multiplier(player: PlayerState, state: DraftState) -> flo
     tier = player.projection.tier
 
     same_group = [
-        ps
-        for ps in state.players.values()
-        if ps.projection.position.value == pos and ps.projection.tier == tier
+        ps for ps in state.get_position_players(pos) if ps.projection.tier == tier
     ]
 
     if not same_group:
@@ -124,15 +135,15 @@ def calculate_need_multiplier(player: PlayerState, state: DraftState) -> float:
     """
     pos = player.projection.position.value
     eligibility = settings.SLOT_ELIGIBILITY
-    open_slots = state.my_team.open_slots_for_position(pos, eligibility)
-    if not open_slots:
-        return 0.0
-    # Only count starter (non-BENCH) slots
-    starter_slots = [
-        s for s in open_slots
-        if state.my_team.slot_types.get(s, s.rstrip("0123456789")) != "BENCH"
-    ]
-    return 1.0 if starter_slots else 0.0
+    my_team = state.my_team
+    # Stop at the first open starter slot that takes this position
+    for slot, occupant in my_team.roster.items():
+        if occupant is not None:
+            continue
+        base_type = my_team.slot_base(slot)
+        if base_type != "BENCH" and pos in eligibility.get(base_type, (base_type,)):
+            return 1.0
+    return 0.0
 
 
 def _has_only_bench_slots(player: PlayerState, state: DraftState) -> bool:
@@ -143,7 +154,7 @@ def _has_only_bench_slots(player: PlayerState, state: DraftState) -> bool:
     if not open_slots:
         return False
     return all(
-        state.my_team.slot_types.get(s, s.rstrip("0123456789")) == "BENCH"
+        state.my_team.slot_base(s) == "BENCH"
         for s in open_slots
     )
 
@@ -5,18 +5,38 @@ Each line in the log file is a JSON object:
   {"seq": int, "ts": float, "type": "draft_update"|"manual", "payload": {...}}
 
 On server restart, events are replayed to reconstruct draft state.
+
+A snapshot of draft state can be written alongside the log
+(<log>.snapshot.json, {"seq": int, "ts": float, "state": {...}}) so that
+recovery only needs to replay events after the snapshot's sequence number.
 """
 
 import json
+import os
 import time
 from pathlib import Path
 from typing import Optional
 
 
+def _record_seq(line: bytes) -> Optional[int]:
+    """The seq of one raw log line, or None if it is blank or not a valid record."""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        record = json.loads(line)
+    except ValueError:  # JSONDecodeError or undecodable bytes
+        return None
+    seq = record.get("seq") if isinstance(record, dict) else None
+    return seq if isinstance(seq, int) else None
+
+
 class EventStore:
     """Singleton append-only event log."""
 
     _instance: Optional["EventStore"] = None
+    SNAPSHOT_INTERVAL = 500  # events between state snapshots
+    TAIL_CHUNK = 64 * 1024  # bytes read per step when recovering the sequence
 
     def __new__(cls):
         if cls._instance is None:
@@ -30,6 +50,7 @@ class EventStore:
         self._initialized = True
         self._path: Optional[Path] = None
         self._seq: int = 0
+        self._snapshot_seq: int = 0
         self._file = None
 
     @classmethod
@@ -40,38 +61,61 @@ class EventStore:
         cls._instance = None
 
     def open(self, path: str):
-        """Open (or create) the event log file. Resumes sequence numbering."""
+        """Open (or create) the event log file. Resumes numbering after the last valid record."""
         self._path = Path(path)
         self._path.parent.mkdir(parents=True, exist_ok=True)
         if self._path.exists():
-            with open(self._path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        json.loads(line)
-                        self._seq += 1
-                    except json.JSONDecodeError:
-                        continue
+            self._seq = self._last_seq()
         self._file = open(self._path, "a", encoding="utf-8")
 
+    def _last_seq(self) -> int:
+        """Sequence number of the last valid record in the log.
+
+        Reads backward from the end of the file in TAIL_CHUNK blocks, so a
+        well-formed log costs one block read and one JSON decode however
+        long it is. Malformed lines (e.g. a write torn by a crash) are
+        skipped."""
+        with open(self._path, "rb") as f:
+            pos = f.seek(0, os.SEEK_END)
+            partial = b""
+            while pos > 0:
+                step = min(self.TAIL_CHUNK, pos)
+                pos -= step
+                f.seek(pos)
+                lines = (f.read(step) + partial).split(b"\n")
+                # The first piece may continue in the previous block
+                partial = lines.pop(0) if pos > 0 else b""
+                for line in reversed(lines):
+                    seq = _record_seq(line)
+                    if seq is not None:
+                        return seq
+        return 0
+
     def append(self, event_type: str, payload: dict):
         """Append an event to the log. Flushes immediately for durability."""
-        if not self._file:
+        self.append_batch([(event_type, payload)])
+
+    def append_batch(self, events: list[tuple[str, dict]]):
+        """Append several (event_type, payload) events with a single write + flush."""
+        if not self._file or not events:
             return
-        self._seq += 1
-        record = {
-            "seq": self._seq,
-            "ts": time.time(),
-            "type": event_type,
-            "payload": payload,
-        }
-        self._file.write(json.dumps(record, default=str) + "\n")
+        now = time.time()
+        lines = []
+        for event_type, payload in events:
+            self._seq += 1
+            record = {
+                "seq": self._seq,
+                "ts": now,
+                "type": event_type,
+                "payload": payload,
+            }
+            lines.append(json.dumps(record, default=str) + "\n")
+        self._file.write("".join(lines))
         self._file.flush()
 
-    def replay(self) -> list[dict]:
-        """Read all events from disk, sorted by sequence number."""
+    def replay(self, after_seq: int = 0) -> list[dict]:
+        """Read events from disk, sorted by sequence number.
+        Only events with seq > after_seq are returned (e.g. those after a snapshot)."""
         if not self._path or not self._path.exists():
             return []
         events = []
@@ -80,18 +124,68 @@ class EventStore:
                 line = line.strip()
                 if line:
                     try:
-                        events.append(json.loads(line))
+                        event = json.loads(line)
                     except json.JSONDecodeError:
                         continue
+                    if event.get("seq", 0) > after_seq:
+                        events.append(event)
         return sorted(events, key=lambda e: e.get("seq", 0))
 
+    # -----------------------------------------------------------------
+    # Snapshots
+    # -----------------------------------------------------------------
+
+    def _snapshot_path(self) -> Optional[Path]:
+        if not self._path:
+            return None
+        return self._path.with_name(self._path.stem + ".snapshot.json")
+
+    def needs_snapshot(self) -> bool:
+        """True once SNAPSHOT_INTERVAL events have been logged since the last snapshot."""
+        return self._seq - self._snapshot_seq >= self.SNAPSHOT_INTERVAL
+
+    def write_snapshot(self, state: dict):
+        """Persist a state snapshot tagged with the current sequence number.
+        Written to a temp file and renamed so a crash never leaves a partial snapshot."""
+        path = self._snapshot_path()
+        if path is None:
+            return
+        record = {"seq": self._seq, "ts": time.time(), "state": state}
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(record, f, default=str)
+        os.replace(tmp, path)
+        self._snapshot_seq = self._seq
+
+    def load_snapshot(self) -> Optional[dict]:
+        """Return the latest snapshot record, or None if missing/unreadable."""
+        path = self._snapshot_path()
+        if path is None or not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                record = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(record, dict) or "state" not in record:
+            return None
+        # A snapshot ahead of the log (log truncated/cleared) can't be trusted
+        if record.get("seq", 0) > self._seq:
+            return None
+        self._snapshot_seq = record.get("seq", 0)
+        return record
+
     def clear(self):
         """Clear the event log (for testing or fresh draft)."""
         if self._file:
             self._file.close()
         if self._path and self._path.exists():
             self._path.unlink()
+        snapshot_path = self._snapshot_path()
+        if snapshot_path and snapshot_path.exists():
+            snapshot_path.unlink()
         self._seq = 0
+        self._snapshot_seq = 0
         if self._path:
             self._file = open(self._path, "a", encoding="utf-8")
 
@@ -16,6 +16,7 @@ Strategy:
 """
 
 import re
+from functools import lru_cache
 from typing import Optional
 
 from rapidfuzz import fuzz, process
@@ -26,12 +27,13 @@ _SUFFIXES = re.compile(
 )
 
 # Punctuation that varies between sources (A.J. vs AJ, D'Andre vs DAndre)
-_PUNCTUATION = re.compile(r"[.\-'']")
+_PUNCTUATION = str.maketrans("", "", ".-'")
 
 # Minimum fuzzy score to accept a match (0-100)
 FUZZY_THRESHOLD = 82
 
 
+@lru_cache(maxsize=4096)
 def normalize_name(name: str) -> str:
     """
     Aggressively normalize a player name for exact-match lookups.
@@ -39,12 +41,13 @@ def normalize_name(name: str) -> str:
     "Patrick Mahomes II" -> "patrick mahomes"
     "Travis Etienne Jr." -> "travis etienne"
     "D'Andre Swift" -> "dandre swift"
+
+    Memoized: the same handful of names arrive on every draft update.
     """
     s = name.strip().lower()
-    s = _PUNCTUATION.sub("", s)      # Remove dots, hyphens, apostrophes
+    s = s.translate(_PUNCTUATION)    # Remove dots, hyphens, apostrophes
     s = _SUFFIXES.sub("", s)         # Remove Jr, Sr, II, III, etc.
-    s = re.sub(r"\s+", " ", s)       # Collapse multiple spaces
-    return s.strip()
+    return " ".join(s.split())       # Collapse whitespace and trim
 
 
 class NameResolver:
@@ -65,6 +68,8 @@ class NameResolver:
         self._cache: dict[str, Optional[str]] = {}
         # list of (normalized_name, canonical_key) for fuzzy search
         self._corpus: list[tuple[str, str]] = []
+        # normalized names only, parallel to _corpus (the fuzzy search choices)
+        self._corpus_names: list[str] = []
 
     def build_index(self, players: dict[str, object]):
         """
@@ -74,6 +79,7 @@ class NameResolver:
         self._normalized_to_canonical.clear()
         self._cache.clear()
         self._corpus.clear()
+        self._corpus_names.clear()
 
         for canonical_key, ps in players.items():
             # The canonical key is already normalize_name(csv_name)
@@ -83,6 +89,7 @@ class NameResolver:
 
             self._normalized_to_canonical[aggressive] = canonical_key
             self._corpus.append((aggressive, canonical_key))
+            self._corpus_names.append(aggressive)
 
             # Also index the canonical key itself (may differ slightly)
             if canonical_key != aggressive:
@@ -113,10 +120,9 @@ class NameResolver:
             self._cache[incoming_name] = None
             return None
 
-        corpus_names = [name for name, _ in self._corpus]
         result = process.extractOne(
             aggressive,
-            corpus_names,
+            self._corpus_names,
             scorer=fuzz.token_sort_ratio,
             score_cutoff=FUZZY_THRESHOLD,
         )
@@ -90,17 +90,13 @@ def load_keepers(state: DraftState) -> list[dict]:
                     # Priority: dedicated position > flex > bench
                     best_slot = None
                     for slot in open_slots:
-                        base_type = state.my_team.slot_types.get(
-                            slot, slot.rstrip("0123456789")
-                        )
+                        base_type = state.my_team.slot_base(slot)
                         if base_type == pos:
                             best_slot = slot
                             break
                     if best_slot is None:
                         for slot in open_slots:
-                            base_type = state.my_team.slot_types.get(
-                                slot, slot.rstrip("0123456789")
-                            )
+                            base_type = state.my_team.slot_base(slot)
                             if base_type not in ("BENCH",):
                                 best_slot = slot
                                 break
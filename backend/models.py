@@ -141,6 +141,12 @@ class MyTeamState(BaseModel):
     # slot_label -> base_type (e.g. {"QB": "QB", "RB1": "RB", "FLEX1": "FLEX"})
     slot_types: dict[str, str] = {}
 
+    def slot_base(self, slot_label: str) -> str:
+        """Base type of a slot label. slot_types covers the configured roster,
+        so the digit-stripping fallback only runs for unknown labels."""
+        base = self.slot_types.get(slot_label)
+        return base if base is not None else slot_label.rstrip("0123456789")
+
     @property
     def roster_spots_remaining(self) -> int:
         return sum(1 for v in self.roster.values() if v is None)
@@ -160,7 +166,7 @@ class MyTeamState(BaseModel):
         for slot_label, occupant in self.roster.items():
             if occupant is not None:
                 continue
-            base_type = self.slot_types.get(slot_label, slot_label.rstrip("0123456789"))
+            base_type = self.slot_base(slot_label)
             eligible_positions = slot_eligibility.get(base_type, [base_type])
             if position in eligible_positions:
                 open_slots.append(slot_label)
@@ -168,31 +174,48 @@ class MyTeamState(BaseModel):
 
     def can_still_start(self, position: str, slot_eligibility: dict[str, list[str]]) -> bool:
         """Can we still fit a player of this position in any open slot?"""
-        return len(self.open_slots_for_position(position, slot_eligibility)) > 0
+        for slot_label, occupant in self.roster.items():
+            if occupant is None:
+                base_type = self.slot_base(slot_label)
+                if position in slot_eligibility.get(base_type, [base_type]):
+                    return True
+        return False
 
     def positional_need_summary(self, slot_eligibility: dict[str, list[str]], exclude_bench: bool = False) -> dict[str, int]:
         """Return {position: number_of_open_slots_that_accept_it}.
-        If exclude_bench=True, only counts starter slots (non-BENCH)."""
+        If exclude_bench=True, only counts starter (non-BENCH) slots.
+        One pass over the open slots, crediting every position each one accepts."""
         positions = set()
         for eligible in slot_eligibility.values():
             positions.update(eligible)
-        result = {}
-        for pos in sorted(positions):
-            open_slots = self.open_slots_for_position(pos, slot_eligibility)
-            if exclude_bench:
-                open_slots = [
-                    s for s in open_slots
-                    if self.slot_types.get(s, s.rstrip("0123456789")) != "BENCH"
-                ]
-            result[pos] = len(open_slots)
+        result = dict.fromkeys(sorted(positions), 0)
+        for slot_label, occupant in self.roster.items():
+            if occupant is not None:
+                continue
+            base_type = self.slot_base(slot_label)
+            if exclude_bench and base_type == "BENCH":
+                continue
+            for pos in set(slot_eligibility.get(base_type, [base_type])):
+                if pos in result:
+                    result[pos] += 1
         return result
 
+    def remove_player(self, player_name: str):
+        """Clear a player from their roster slot(s) and the acquired list (case-insensitive)."""
+        name_lower = player_name.lower()
+        for slot, occupant in self.roster.items():
+            if occupant and occupant.lower() == name_lower:
+                self.roster[slot] = None
+        self.players_acquired = [
+            p for p in self.players_acquired if p["name"].lower() != name_lower
+        ]
+
     @property
     def bench_spots_remaining(self) -> int:
         """Count empty BENCH slots."""
         return sum(
             1 for slot, occupant in self.roster.items()
-            if occupant is None and self.slot_types.get(slot, slot.rstrip("0123456789")) == "BENCH"
+            if occupant is None and self.slot_base(slot) == "BENCH"
         )
 
 
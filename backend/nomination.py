@@ -15,7 +15,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from state import DraftState
 
-from engine import calculate_fmv, calculate_scarcity_multiplier
+from engine import calculate_fmv, calculate_fmv_batch, calculate_scarcity_multiplier
 from config import settings
 
 
@@ -24,15 +24,15 @@ def _get_opponent_needs_by_team(state: "DraftState") -> dict[str, set[str]]:
     tracker = state.opponent_tracker
     if not tracker or not tracker.team_rosters:
         return {}
+    # Slot capacity per position is the same for every team
+    max_slots = {
+        pos: tracker._max_slots_for_position(pos) for pos in settings.display_positions
+    }
     needs: dict[str, set[str]] = {}
     for team_id, pos_counts in tracker.team_rosters.items():
-        team_needs = set()
-        for pos in settings.display_positions:
-            max_slots = tracker._max_slots_for_position(pos)
-            filled = pos_counts.get(pos, 0)
-            if filled < max_slots:
-                team_needs.add(pos)
-        needs[team_id] = team_needs
+        needs[team_id] = {
+            pos for pos, cap in max_slots.items() if pos_counts.get(pos, 0) < cap
+        }
     return needs
 
 
@@ -81,14 +81,30 @@ def get_nomination_suggestions(state: "DraftState", top_n: int = 5) -> list[dict
         tid = t["team_id"]
         rich_team_needs[tid] = opponent_needs.get(tid, set())
 
+    # Inputs that depend only on position (or position + tier) are shared by
+    # every candidate there; compute each once per call, on first use
+    scarcity_by_group: dict[tuple[str, int], float] = {}
+    opp_needing_by_pos: dict[str, int] = {}
+    remaining_count_by_pos: dict[str, int] = {}
+    top_fmv_by_pos: dict[str, float] = {}
+
+    def remaining_at(pos: str) -> int:
+        if pos not in remaining_count_by_pos:
+            remaining_count_by_pos[pos] = len(state.get_remaining_players(pos))
+        return remaining_count_by_pos[pos]
+
     suggestions = []
 
-    for ps in remaining:
+    for ps, fmv in zip(remaining, calculate_fmv_batch(remaining, state)):
         pos = ps.projection.position.value
-        fmv = calculate_fmv(ps, state)
-        scarcity = calculate_scarcity_multiplier(ps, state)
+        group = (pos, ps.projection.tier)
+        scarcity = scarcity_by_group.get(group)
+        if scarcity is None:
+            scarcity = scarcity_by_group[group] = calculate_scarcity_multiplier(ps, state)
         my_need_count = my_needs.get(pos, 0)
-        opp_teams_needing = _teams_needing_position(opponent_needs, pos)
+        opp_teams_needing = opp_needing_by_pos.get(pos)
+        if opp_teams_needing is None:
+            opp_teams_needing = opp_needing_by_pos[pos] = _teams_needing_position(opponent_needs, pos)
 
         # --- Strategy A: Targeted Budget Drain ---
         # Nominate expensive players that RICH teams specifically need
@@ -113,7 +129,7 @@ def get_nomination_suggestions(state: "DraftState", top_n: int = 5) -> list[dict
         if scarcity >= 1.15 and my_need_count == 0:
             demand_info = ""
             if state.opponent_tracker:
-                remaining_at_pos = len(state.get_remaining_players(pos))
+                remaining_at_pos = remaining_at(pos)
                 demand = state.opponent_tracker.get_position_demand(pos, remaining_at_pos)
                 if demand.get("bidding_war_risk"):
                     demand_info = f" {demand['teams_needing']} teams fighting over {demand['players_remaining']} left."
@@ -129,7 +145,7 @@ def get_nomination_suggestions(state: "DraftState", top_n: int = 5) -> list[dict
         # --- Strategy C: Poison Pill ---
         # Player that 2+ rival teams desperately need — force them to bid each other up
         if my_need_count == 0 and opp_teams_needing >= 2 and fmv > 10:
-            remaining_at_pos = len(state.get_remaining_players(pos))
+            remaining_at_pos = remaining_at(pos)
             ratio = opp_teams_needing / max(remaining_at_pos, 1)
             if ratio >= 0.5:  # More teams than supply
                 suggestions.append({
@@ -153,8 +169,10 @@ def get_nomination_suggestions(state: "DraftState", top_n: int = 5) -> list[dict
             }.get(phase, 0.25)
 
             # Get max FMV at this position for relative threshold
-            pos_remaining = state.get_remaining_players(pos)
-            max_pos_fmv = calculate_fmv(pos_remaining[0], state) if pos_remaining else fmv
+            max_pos_fmv = top_fmv_by_pos.get(pos)
+            if max_pos_fmv is None:
+                pos_remaining = state.get_remaining_players(pos, top_n=1)
+                max_pos_fmv = top_fmv_by_pos[pos] = calculate_fmv(pos_remaining[0], state)
             threshold_fmv = max_pos_fmv * bargain_threshold
 
             if fmv <= threshold_fmv:
@@ -5,7 +5,7 @@ Identifies bidding war scenarios and surfaces demand data.
 """
 
 from typing import Optional
-from config import settings
+from config import settings, parse_team_aliases
 
 
 class OpponentTracker:
@@ -38,12 +38,12 @@ class OpponentTracker:
             if tid is not None:
                 team_map[str(tid)] = {"name": name, "budget": budget, "rosterSize": rsize}
 
+        # Skip my own team (my_team_name may be comma-separated aliases)
+        my_aliases = parse_team_aliases(my_team_name)
         for team_id_str, entries in rosters.items():
             info = team_map.get(team_id_str, {})
             team_name = info.get("name", f"Team #{team_id_str}")
 
-            # Skip my own team (my_team_name may be comma-separated aliases)
-            my_aliases = [a.strip().lower() for a in my_team_name.split(",")]
             if team_name and team_name.lower().strip() in my_aliases:
                 continue
 
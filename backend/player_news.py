@@ -28,22 +28,21 @@ def _build_name_index(db: dict) -> dict[str, dict]:
     assignment (i.e. the fantasy-relevant one).
     """
     index: dict[str, dict] = {}
-    for pid, info in db.items():
+    # key -> (active, has team) of the entry currently indexed under it
+    ranks: dict[str, tuple[bool, bool]] = {}
+    for info in db.values():
         if not isinstance(info, dict):
             continue
         full = info.get("full_name")
         if not full:
             continue
         key = full.lower()
-        existing = index.get(key)
-        if existing is None:
+        # Resolve duplicates: prefer active player with a team
+        rank = (bool(info.get("active")), bool(info.get("team")))
+        previous = ranks.get(key)
+        if previous is None or rank > previous:
             index[key] = info
-        else:
-            # Resolve duplicates: prefer active player with a team
-            new_score = (bool(info.get("active")), bool(info.get("team")))
-            old_score = (bool(existing.get("active")), bool(existing.get("team")))
-            if new_score > old_score:
-                index[key] = info
+            ranks[key] = rank
     return index
 
 
@@ -71,7 +70,7 @@ def _find_player(player_name: str) -> Optional[dict]:
     When multiple players share a name, prefer active fantasy-relevant players.
 
     Uses a pre-built name index for O(1) exact-match lookup.  Falls back
-    to a linear scan if the index misses (e.g. alternate name formats).
+    to a linear scan only if no index has been built.
     """
     name_lower = player_name.lower().strip()
 
@@ -80,7 +79,12 @@ def _find_player(player_name: str) -> Optional[dict]:
     if hit is not None:
         return hit
 
-    # Slow fallback: linear scan for partial matches or names not in the index
+    # The index holds every full_name in the database, so once it is built a
+    # miss is final — don't pay a scan over ~10K entries for each unknown name
+    if _name_index:
+        return None
+
+    # Slow fallback: linear scan when the index hasn't been built for this db
     matches = []
     for pid, info in _player_db.items():
         if not isinstance(info, dict):
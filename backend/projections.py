@@ -28,8 +28,9 @@ def load_and_merge_projections(
     if weights is None:
         weights = [1.0] * len(csv_paths)
 
-    # player_key -> list of source records
-    player_data: dict[str, list[dict]] = {}
+    # player_key -> running weighted totals, accumulated while reading so
+    # each row is touched once (no per-player re-scan of its sources)
+    player_data: dict[str, dict] = {}
 
     for path_str, weight in zip(csv_paths, weights):
         path = Path(path_str)
@@ -41,30 +42,36 @@ def load_and_merge_projections(
             for row in reader:
                 name = row["PlayerName"].strip()
                 key = normalize_name(name)
-                player_data.setdefault(key, []).append({
-                    "weight": weight,
-                    "points": float(row["ProjectedPoints"]),
-                    "aav": float(row["BaselineAAV"]),
-                    "position": row["Position"].strip().upper(),
-                    "tier": int(row["Tier"]),
-                    "name": name,
-                })
+                points = float(row["ProjectedPoints"])
+                aav = float(row["BaselineAAV"])
+                entry = player_data.get(key)
+                if entry is None:
+                    entry = player_data[key] = {
+                        "total_weight": 0, "points": 0, "aav": 0, "count": 0,
+                        "best_weight": None,
+                    }
+                entry["total_weight"] += weight
+                entry["points"] += points * weight
+                entry["aav"] += aav * weight
+                entry["count"] += 1
+                # Use position/tier/name from highest-weight source (first wins ties)
+                if entry["best_weight"] is None or weight > entry["best_weight"]:
+                    entry["best_weight"] = weight
+                    entry["name"] = name
+                    entry["position"] = row["Position"].strip().upper()
+                    entry["tier"] = int(row["Tier"])
 
     # Merge: weighted average of points and AAV
     merged = []
-    for key, sources in player_data.items():
-        total_weight = sum(s["weight"] for s in sources)
-        avg_points = sum(s["points"] * s["weight"] for s in sources) / total_weight
-        avg_aav = sum(s["aav"] * s["weight"] for s in sources) / total_weight
-        # Use position/tier/name from highest-weight source
-        best = max(sources, key=lambda s: s["weight"])
+    for entry in player_data.values():
+        total_weight = entry["total_weight"]
         merged.append({
-            "PlayerName": best["name"],
-            "Position": best["position"],
-            "ProjectedPoints": str(round(avg_points, 1)),
-            "BaselineAAV": str(round(avg_aav, 1)),
-            "Tier": str(best["tier"]),
-            "source_count": len(sources),
+            "PlayerName": entry["name"],
+            "Position": entry["position"],
+            "ProjectedPoints": str(round(entry["points"] / total_weight, 1)),
+            "BaselineAAV": str(round(entry["aav"] / total_weight, 1)),
+            "Tier": str(entry["tier"]),
+            "source_count": entry["count"],
         })
 
     return merged
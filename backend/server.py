@@ -8,14 +8,16 @@ Run with: uvicorn server:app --host 0.0.0.0 --port 8000 --reload
 
 import asyncio
 import json
+import logging
+import logging.handlers
+import queue
+import re
 import time
 from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Optional
 
-import re
-
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, Query
+from fastapi import FastAPI, HTTPException, Request, Response, WebSocket, WebSocketDisconnect, Query
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
@@ -34,6 +36,24 @@ import draft_plan
 
 _start_time = time.time()
 
+# Terminal logging goes through a queue so the request path never blocks on
+# stdout; a listener thread (started in lifespan) does the actual writes.
+log = logging.getLogger("faa")
+log.setLevel(logging.INFO)
+log.propagate = False
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+log.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_stream = logging.StreamHandler()
+_log_stream.setFormatter(logging.Formatter("[%(asctime)s] %(message)s", datefmt="%H:%M:%S"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream)
+
+# Manual override command patterns (shared by /manual and event replay)
+_UNDO_RE = re.compile(r"^undo\s+(.+)$", re.IGNORECASE)
+_BUDGET_RE = re.compile(r"^budget\s+(\d+)$", re.IGNORECASE)
+_WHATIF_RE = re.compile(r"^whatif\s+(.+?)\s+(\d+)\s*$", re.IGNORECASE)
+_NOM_RE = re.compile(r"^nom\s+(.+?)(?:\s+(\d+))?\s*$", re.IGNORECASE)
+_SOLD_RE = re.compile(r"^(.+?)\s+(\d+)(?:\s+(\d+))?\s*$")
+
 
 # -----------------------------------------------------------------
 # Lifespan: load CSV on startup
@@ -41,7 +61,16 @@ _start_time = time.time()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    _log_listener.start()
     state = DraftState()
+    # Endpoints read these from request.app.state rather than calling the
+    # singleton constructors on every request
+    app.state.draft_state = state
+    app.state.ticker = TickerBuffer()
+
+    # Background AI pre-computation: bounded concurrency, strong task refs
+    app.state.ai_semaphore = asyncio.Semaphore(settings.max_ai_concurrency)
+    app.state.ai_tasks = set()
 
     # Load projections — multi-source if configured, single CSV otherwise
     if settings.csv_paths:
@@ -52,7 +81,7 @@ async def lifespan(app: FastAPI):
         merged = load_and_merge_projections(paths, weights)
         state.load_from_merged(merged)
         state.active_sheet = "merged"
-        print(f"  Multi-source: merged {len(paths)} CSVs")
+        log.info("  Multi-source: merged %s CSVs", len(paths))
     else:
         state.load_projections(settings.csv_path)
         # active_sheet is set inside load_projections via path.stem
@@ -67,13 +96,13 @@ async def lifespan(app: FastAPI):
             if player:
                 player.adp_value = adp_val
                 matched += 1
-        print(f"  ADP loaded: {matched}/{len(adp_data)} players matched")
+        log.info("  ADP loaded: %s/%s players matched", matched, len(adp_data))
 
     # Load keepers (must happen AFTER projections, BEFORE event replay)
     from keepers import load_keepers
     keepers = load_keepers(state)
     if keepers:
-        print(f"  [Keepers] Loaded {len(keepers)} keeper(s)")
+        log.info("  [Keepers] Loaded %s keeper(s)", len(keepers))
 
     # Load player news/injury data from Sleeper API
     await player_news.ensure_loaded()
@@ -81,10 +110,16 @@ async def lifespan(app: FastAPI):
     # Open event store and replay any existing events for crash recovery
     event_store = EventStore()
     event_store.open(settings.event_log_path)
-    events = event_store.replay()
+    snapshot = event_store.load_snapshot()
+    if snapshot:
+        state.restore_snapshot(snapshot["state"])
+        log.info("  Restored snapshot at event #%s", snapshot["seq"])
+        events = event_store.replay(after_seq=snapshot["seq"])
+    else:
+        events = event_store.replay()
     replayed = 0
     if events:
-        print(f"  Replaying {len(events)} events from log...")
+        log.info("  Replaying %s events from log...", len(events))
         for event in events:
             if event["type"] == "draft_update":
                 try:
@@ -92,7 +127,7 @@ async def lifespan(app: FastAPI):
                     state.update_from_draft_event(update)
                     replayed += 1
                 except Exception as e:
-                    print(f"  WARNING: Skip replay event #{event.get('seq')}: {e}")
+                    log.warning("  Skip replay event #%s: %s", event.get("seq"), e)
             elif event["type"] == "manual":
                 cmd = event["payload"].get("command", "")
                 # Replay sold/budget/undo commands (skip nom which is read-only)
@@ -100,20 +135,23 @@ async def lifespan(app: FastAPI):
                     _replay_manual_command(cmd, state)
                     replayed += 1
 
-    print(f"\n{'='*60}")
-    print(f"  Fantasy Auction Assistant")
-    print(f"{'='*60}")
-    print(f"  Platform:        {settings.platform}")
-    print(f"  Sport:           {settings.sport_name}")
-    print(f"  Roster slots:    {settings.roster_slots}")
-    print(f"  Players loaded:  {len(state.players)}")
-    drafted = sum(1 for ps in state.players.values() if ps.is_drafted)
+    # New events are queued by endpoints and written by a background task
+    app.state.event_queue = asyncio.Queue()
+    event_writer = asyncio.create_task(_event_writer_loop(event_store, app.state.event_queue, state))
+
+    log.info("=" * 60)
+    log.info("  Fantasy Auction Assistant")
+    log.info("=" * 60)
+    log.info("  Platform:        %s", settings.platform)
+    log.info("  Sport:           %s", settings.sport_name)
+    log.info("  Roster slots:    %s", settings.roster_slots)
+    log.info("  Players loaded:  %s", len(state.players))
     if replayed:
-        print(f"  Events replayed: {replayed} ({drafted} players drafted)")
-    print(f"  My team:         {settings.my_team_name}")
-    print(f"  Budget:          ${settings.budget}")
-    print(f"  League size:     {settings.league_size}")
-    print(f"  Inflation:       {state.get_inflation_factor():.3f}")
+        log.info("  Events replayed: %s (%s players drafted)", replayed, state.drafted_count)
+    log.info("  My team:         %s", settings.my_team_name)
+    log.info("  Budget:          $%s", settings.budget)
+    log.info("  League size:     %s", settings.league_size)
+    log.info("  Inflation:       %.3f", state.get_inflation_factor())
     from ai_advisor import _has_ai_key
     provider = settings.ai_provider.lower()
     if _has_ai_key():
@@ -121,16 +159,20 @@ async def lifespan(app: FastAPI):
         ai_display = f"{provider} ({model})"
     else:
         ai_display = "not configured (engine-only mode)"
-    print(f"  AI Provider:     {ai_display}")
-    print(f"{'='*60}\n")
+    log.info("  AI Provider:     %s", ai_display)
+    log.info("=" * 60)
     yield
     await close_http_client()
+    # Flush any queued events before closing the log
+    await app.state.event_queue.join()
+    event_writer.cancel()
     event_store.close()
+    _log_listener.stop()
 
 
 def _replay_manual_command(cmd: str, state: DraftState):
     """Replay a manual command during event log recovery (no logging, no event store writes)."""
-    undo_match = re.match(r"^undo\s+(.+)$", cmd, re.IGNORECASE)
+    undo_match = _UNDO_RE.match(cmd)
     if undo_match:
         player_name = undo_match.group(1).strip()
         player = state.get_player(player_name)
@@ -138,17 +180,11 @@ def _replay_manual_command(cmd: str, state: DraftState):
             player.is_drafted = False
             player.draft_price = None
             player.drafted_by_team = None
-            for slot, occupant in state.my_team.roster.items():
-                if occupant and occupant.lower() == player.projection.player_name.lower():
-                    state.my_team.roster[slot] = None
-            state.my_team.players_acquired = [
-                p for p in state.my_team.players_acquired
-                if p["name"].lower() != player.projection.player_name.lower()
-            ]
+            state.my_team.remove_player(player.projection.player_name)
             state._recompute_aggregates()
         return
 
-    budget_match = re.match(r"^budget\s+(\d+)$", cmd, re.IGNORECASE)
+    budget_match = _BUDGET_RE.match(cmd)
     if budget_match:
         new_budget = int(budget_match.group(1))
         state.my_team.budget = new_budget
@@ -158,7 +194,7 @@ def _replay_manual_command(cmd: str, state: DraftState):
         state._recompute_aggregates()
         return
 
-    sold_match = re.match(r"^(.+?)\s+(\d+)(?:\s+(\d+))?\s*$", cmd)
+    sold_match = _SOLD_RE.match(cmd)
     if sold_match:
         player_name = sold_match.group(1).strip()
         price = int(sold_match.group(2))
@@ -185,7 +221,13 @@ app.add_middleware(
 # WebSocket clients
 # -----------------------------------------------------------------
 
-ws_clients: list[WebSocket] = []
+ws_clients: set[WebSocket] = set()
+
+# Max concurrent sends per broadcast batch
+_WS_BROADCAST_BATCH = 50
+
+# Max events written per event-log flush
+_EVENT_BATCH_MAX = 64
 
 
 # -----------------------------------------------------------------
@@ -193,14 +235,14 @@ ws_clients: list[WebSocket] = []
 # -----------------------------------------------------------------
 
 @app.post("/draft_update")
-async def draft_update(data: DraftUpdate):
+async def draft_update(data: DraftUpdate, request: Request):
     """
     Receives draft data from the Chrome extension.
     Updates state, computes engine advice, fires off async AI pre-computation,
     and returns advice in the format the extension expects.
     """
-    state = DraftState()
-    ticker = TickerBuffer()
+    state = request.app.state.draft_state
+    ticker = request.app.state.ticker
 
     # Auto-detect platform from extension payload
     if data.platform and data.platform.lower() in ("espn", "sleeper"):
@@ -216,13 +258,15 @@ async def draft_update(data: DraftUpdate):
     state.update_from_draft_event(data)
 
     # Process newly drafted players for ticker
-    for ps in state.newly_drafted:
-        from engine import calculate_fmv
-        fmv = calculate_fmv(ps, state)
+    from engine import calculate_fmv_batch
+    now = time.time()
+    sold_fmvs = calculate_fmv_batch(state.newly_drafted, state)
+    ticker_events = []
+    for ps, fmv in zip(state.newly_drafted, sold_fmvs):
         team = ps.drafted_by_team or "Unknown"
-        ticker.push(TickerEvent(
+        ticker_events.append(TickerEvent(
             event_type=TickerEventType.PLAYER_SOLD,
-            timestamp=time.time(),
+            timestamp=now,
             message=f"{ps.projection.player_name} sold to {team} for ${ps.draft_price} (FMV ${round(fmv, 1)})",
             player_name=ps.projection.player_name,
             team_name=team,
@@ -234,24 +278,24 @@ async def draft_update(data: DraftUpdate):
         if team.remainingBudget is not None and team.rosterSize is not None:
             empty_slots = max(0, settings.roster_size - (team.rosterSize or 0))
             if empty_slots > 0 and team.remainingBudget <= empty_slots + 2:
-                ticker.push(TickerEvent(
+                ticker_events.append(TickerEvent(
                     event_type=TickerEventType.BUDGET_ALERT,
-                    timestamp=time.time(),
+                    timestamp=now,
                     message=f"BUDGET ALERT: {team.name} has ${team.remainingBudget} for {empty_slots} slots",
                     team_name=team.name,
                     amount=float(team.remainingBudget),
                 ))
+    ticker.push_many(ticker_events)
 
     # Invalidate draft plan cache when players are drafted
     if state.newly_drafted:
         draft_plan.invalidate_plan()
 
     # Persist event for crash recovery
-    EventStore().append("draft_update", data.model_dump())
+    request.app.state.event_queue.put_nowait(("draft_update", data.model_dump()))
 
     # Terminal logging
-    now = datetime.now().strftime("%H:%M:%S")
-    print(f"\n[{now}] Draft Update ({settings.platform})")
+    log.info("Draft Update (%s)", settings.platform)
 
     player_name: Optional[str] = None
     current_bid: float = 0
@@ -259,9 +303,9 @@ async def draft_update(data: DraftUpdate):
     if data.currentNomination:
         player_name = data.currentNomination.playerName
         current_bid = data.currentBid or 0
-        print(f"  Player: {player_name}  |  Bid: ${int(current_bid)}  |  Inflation: {state.get_inflation_factor():.3f}")
+        log.info("  Player: %s  |  Bid: $%s  |  Inflation: %.3f", player_name, int(current_bid), state.get_inflation_factor())
     elif data.teams:
-        print(f"  No active nomination  |  Teams: {len(data.teams)}  |  Picks: {len(data.draftLog)}")
+        log.info("  No active nomination  |  Teams: %s  |  Picks: %s", len(data.teams), len(data.draftLog))
 
     # Compute engine advice (fast, synchronous, pure math)
     advice_html = "Waiting for a nomination..."
@@ -280,11 +324,11 @@ async def draft_update(data: DraftUpdate):
         _ai_key = player_name.lower().strip()
         _ai_cached = _advice_cache.get(_ai_key)
         if not _ai_cached or (time.time() - _ai_cached[1]) >= _AI_TTL:
-            asyncio.create_task(precompute_advice(player_name, current_bid, state))
+            _spawn_precompute(request.app, player_name, current_bid, state)
 
         # Build HTML for the overlay
         advice_html = _format_advice_html(player_name, current_bid, engine_advice)
-        print(f"  >> {engine_advice.action.value}: max ${engine_advice.max_bid}, FMV ${engine_advice.fmv}")
+        log.info("  >> %s: max $%s, FMV $%s", engine_advice.action.value, engine_advice.max_bid, engine_advice.fmv)
 
         response = {
             "advice": advice_html,
@@ -300,26 +344,25 @@ async def draft_update(data: DraftUpdate):
         # Broadcast full snapshot to WebSocket dashboard clients
         await _broadcast_ws({
             "type": "state_snapshot",
-            "data": _get_dashboard_snapshot(state),
+            "data": _get_dashboard_snapshot(state, ticker),
         })
 
     return response
 
 
 @app.get("/advice")
-async def get_advice(player: str = Query(..., description="Player name")):
+async def get_advice(request: Request, player: str = Query(..., description="Player name")):
     """
     Returns AI-enhanced advice (cached) or computes on the fly.
     Use this for on-demand lookups from a custom UI.
     """
-    state = DraftState()
+    state = request.app.state.draft_state
     current_bid: float = 0
 
     # Use current bid from latest state if this is the nominated player
-    raw_nom = state.raw_latest.get("currentNomination")
-    if raw_nom and isinstance(raw_nom, dict):
-        if raw_nom.get("playerName", "").lower() == player.lower():
-            current_bid = state.raw_latest.get("currentBid") or 0
+    nom = state.current_nomination
+    if nom and nom[0] == player.lower():
+        current_bid = nom[1]
 
     engine_advice = get_engine_advice(player, current_bid, state)
     full_advice = await get_ai_advice(player, current_bid, state, engine_advice)
@@ -336,7 +379,7 @@ class ManualInput(BaseModel):
 
 
 @app.post("/manual")
-async def manual_override(data: ManualInput):
+async def manual_override(data: ManualInput, request: Request):
     """
     Manual override for when the scraper fails or you need to correct state.
 
@@ -348,13 +391,12 @@ async def manual_override(data: ManualInput):
       "nom PlayerName"               — Get advice for a player without a live bid
       "nom PlayerName Price"         — Get advice for a player at a specific bid
     """
-    state = DraftState()
+    state = request.app.state.draft_state
     cmd = data.command.strip()
-    now = datetime.now().strftime("%H:%M:%S")
-    print(f"\n[{now}] Manual Override: \"{cmd}\"")
+    log.info("Manual Override: \"%s\"", cmd)
 
     # --- UNDO: "undo PlayerName" ---
-    undo_match = re.match(r"^undo\s+(.+)$", cmd, re.IGNORECASE)
+    undo_match = _UNDO_RE.match(cmd)
     if undo_match:
         player_name = undo_match.group(1).strip()
         player = state.get_player(player_name)
@@ -363,16 +405,10 @@ async def manual_override(data: ManualInput):
             player.draft_price = None
             player.drafted_by_team = None
             # Remove from my roster if present
-            for slot, occupant in state.my_team.roster.items():
-                if occupant and occupant.lower() == player.projection.player_name.lower():
-                    state.my_team.roster[slot] = None
-            state.my_team.players_acquired = [
-                p for p in state.my_team.players_acquired
-                if p["name"].lower() != player.projection.player_name.lower()
-            ]
+            state.my_team.remove_player(player.projection.player_name)
             state._recompute_aggregates()
-            EventStore().append("manual", {"command": cmd})
-            print(f"  Undrafted: {player.projection.player_name}")
+            request.app.state.event_queue.put_nowait(("manual", {"command": cmd}))
+            log.info("  Undrafted: %s", player.projection.player_name)
             return {
                 "status": "ok",
                 "action": "undo",
@@ -385,7 +421,7 @@ async def manual_override(data: ManualInput):
         }
 
     # --- BUDGET: "budget 180" ---
-    budget_match = re.match(r"^budget\s+(\d+)$", cmd, re.IGNORECASE)
+    budget_match = _BUDGET_RE.match(cmd)
     if budget_match:
         new_budget = int(budget_match.group(1))
         old_budget = state.my_team.budget
@@ -395,8 +431,8 @@ async def manual_override(data: ManualInput):
             if key.lower().strip() == settings.my_team_name.lower().strip():
                 state.team_budgets[key] = new_budget
         state._recompute_aggregates()
-        EventStore().append("manual", {"command": cmd})
-        print(f"  Budget: ${old_budget} -> ${new_budget}")
+        request.app.state.event_queue.put_nowait(("manual", {"command": cmd}))
+        log.info("  Budget: $%s -> $%s", old_budget, new_budget)
         return {
             "status": "ok",
             "action": "budget",
@@ -420,7 +456,7 @@ async def manual_override(data: ManualInput):
         return {"status": "ok", "action": "suggest", "advice": "<br>".join(lines), "suggestions": suggestions}
 
     # --- WHATIF: "whatif PlayerName Price" ---
-    whatif_match = re.match(r"^whatif\s+(.+?)\s+(\d+)\s*$", cmd, re.IGNORECASE)
+    whatif_match = _WHATIF_RE.match(cmd)
     if whatif_match:
         from what_if import simulate_what_if
         player_name = whatif_match.group(1).strip()
@@ -439,13 +475,13 @@ async def manual_override(data: ManualInput):
         return {"status": "ok", "action": "whatif", "advice": "<br>".join(lines)}
 
     # --- NOM: "nom PlayerName" or "nom PlayerName Price" ---
-    nom_match = re.match(r"^nom\s+(.+?)(?:\s+(\d+))?\s*$", cmd, re.IGNORECASE)
+    nom_match = _NOM_RE.match(cmd)
     if nom_match:
         player_name = nom_match.group(1).strip()
         bid = float(nom_match.group(2)) if nom_match.group(2) else 0
         engine_advice = get_engine_advice(player_name, bid, state)
         advice_html = _format_advice_html(player_name, bid, engine_advice)
-        print(f"  Nom lookup: {player_name} @ ${int(bid)} -> {engine_advice.action.value}")
+        log.info("  Nom lookup: %s @ $%s -> %s", player_name, int(bid), engine_advice.action.value)
         return {
             "status": "ok",
             "action": "nom",
@@ -455,7 +491,7 @@ async def manual_override(data: ManualInput):
         }
 
     # --- SOLD: "PlayerName Price" or "PlayerName Price TeamId" ---
-    sold_match = re.match(r"^(.+?)\s+(\d+)(?:\s+(\d+))?\s*$", cmd)
+    sold_match = _SOLD_RE.match(cmd)
     if sold_match:
         player_name = sold_match.group(1).strip()
         price = int(sold_match.group(2))
@@ -479,9 +515,9 @@ async def manual_override(data: ManualInput):
         team_label = f"Team #{team_id}" if team_id else "Unknown Team"
         player.drafted_by_team = team_label
         state._recompute_aggregates()
-        EventStore().append("manual", {"command": cmd})
+        request.app.state.event_queue.put_nowait(("manual", {"command": cmd}))
 
-        print(f"  Sold: {player.projection.player_name} for ${price} to {team_label}")
+        log.info("  Sold: %s for $%s to %s", player.projection.player_name, price, team_label)
         return {
             "status": "ok",
             "action": "sold",
@@ -506,38 +542,38 @@ async def manual_override(data: ManualInput):
 
 
 @app.get("/health")
-async def health_check():
+async def health_check(request: Request):
     """Heartbeat endpoint for the extension's 5-second health polling."""
-    state = DraftState()
-    drafted = sum(1 for ps in state.players.values() if ps.is_drafted)
+    state = request.app.state.draft_state
     return {
         "status": "ok",
         "uptime": round(time.time() - _start_time, 1),
-        "drafted_count": drafted,
+        "drafted_count": state.drafted_count,
         "inflation": round(state.get_inflation_factor(), 3),
     }
 
 
 @app.get("/team_aliases")
-async def get_team_aliases():
+async def get_team_aliases(request: Request):
     """Get current team aliases."""
-    state = DraftState()
+    state = request.app.state.draft_state
     return {"aliases": state.team_aliases, "teams": list(state.team_budgets.keys())}
 
 
 @app.post("/team_aliases")
-async def set_team_aliases(request: dict):
+async def set_team_aliases(aliases: dict, request: Request):
     """Set team display aliases. Body: {"Team 1": "Alice", "Team 3": "Me"}"""
-    state = DraftState()
-    for original, alias in request.items():
+    state = request.app.state.draft_state
+    for original, alias in aliases.items():
         if isinstance(alias, str) and alias.strip():
             state.team_aliases[original] = alias.strip()
             # If the alias matches MY_TEAM_NAME, register the original so _is_my_team works
-            existing = [a.strip().lower() for a in settings.my_team_name.split(",")]
-            if state._is_my_team(alias) and original.strip().lower() not in existing:
+            if state._is_my_team(alias) and original.strip().lower() not in settings.my_team_aliases:
                 settings.my_team_name = settings.my_team_name + "," + original
-                print(f"  [Alias] Registered '{original}' as my team alias")
-    print(f"  [Alias] Team aliases: {state.team_aliases}")
+                log.info("  [Alias] Registered '%s' as my team alias", original)
+    # Aliases change display names throughout the cached snapshot
+    state.version += 1
+    log.info("  [Alias] Team aliases: %s", state.team_aliases)
     return {"aliases": state.team_aliases}
 
 
@@ -552,7 +588,7 @@ async def set_strategy(request: dict):
 
 
 @app.post("/projection-sheet")
-async def switch_projection_sheet(body: dict):
+async def switch_projection_sheet(body: dict, request: Request):
     """Switch the active projection sheet and recompute all values."""
     sheet_name = body.get("sheet")
     available = settings.available_sheets
@@ -561,64 +597,64 @@ async def switch_projection_sheet(body: dict):
         raise HTTPException(400, f"Unknown sheet: {sheet_name}. Available: {list(available.keys())}")
 
     path = available[sheet_name]
-    state = DraftState()
+    state = request.app.state.draft_state
 
     # Reload projections from the new sheet, preserving draft progress
     state.reload_projections(path)
 
     # Broadcast updated snapshot to WebSocket dashboard clients
-    snapshot = _get_dashboard_snapshot(state)
+    snapshot = _get_dashboard_snapshot(state, request.app.state.ticker)
     await _broadcast_ws({"type": "state_snapshot", "data": snapshot})
 
     return {"active_sheet": sheet_name, "player_count": len(state.players)}
 
 
 @app.get("/opponents")
-async def get_opponents():
+async def get_opponents(request: Request):
     """View opponent positional needs and threat levels."""
-    state = DraftState()
+    state = request.app.state.draft_state
     return state.opponent_tracker.get_summary()
 
 
 @app.get("/sleepers")
-async def get_sleepers():
+async def get_sleepers(request: Request):
     """End-of-draft bargain targets — players likely to go for $1-3."""
     from sleeper_watch import get_sleeper_candidates
-    state = DraftState()
+    state = request.app.state.draft_state
     return {"sleepers": get_sleeper_candidates(state)}
 
 
 @app.get("/nominate")
-async def get_nominations():
+async def get_nominations(request: Request):
     """Nomination strategy suggestions for when it's your turn to nominate."""
     from nomination import get_nomination_suggestions
-    state = DraftState()
+    state = request.app.state.draft_state
     return {"suggestions": get_nomination_suggestions(state)}
 
 
 @app.get("/stream/{player}")
-async def stream_advice(player: str, bid: float = 0):
+async def stream_advice(player: str, request: Request, bid: float = 0):
     """Get advice for a player. Returns cached AI advice or engine-only."""
-    state = DraftState()
+    state = request.app.state.draft_state
     engine_advice = get_engine_advice(player, bid, state)
     full_advice = await get_ai_advice(player, bid, state, engine_advice)
     return full_advice.model_dump()
 
 
 @app.get("/whatif")
-async def whatif(player: str = Query(...), price: int = Query(...)):
+async def whatif(request: Request, player: str = Query(...), price: int = Query(...)):
     """What-if simulation: what happens if I spend $X on this player?"""
     from what_if import simulate_what_if
-    state = DraftState()
+    state = request.app.state.draft_state
     return simulate_what_if(player, price, state)
 
 
 @app.get("/grade")
-async def grade():
+async def grade(request: Request):
     """Post-draft team grade and analysis."""
     from grader import build_grade_prompt
     from ai_advisor import get_draft_grade
-    state = DraftState()
+    state = request.app.state.draft_state
     prompt = build_grade_prompt(state)
     result = await get_draft_grade(prompt)
     if result:
@@ -628,14 +664,14 @@ async def grade():
 
 
 @app.get("/export")
-async def export_draft_results(format: str = "json"):
+async def export_draft_results(request: Request, format: str = "json"):
     """Export draft results as JSON or CSV."""
     from engine import calculate_fmv
     import io
     import csv as csv_mod
     from starlette.responses import StreamingResponse
 
-    state = DraftState()
+    state = request.app.state.draft_state
 
     # Build export data from all drafted players
     picks = []
@@ -656,8 +692,7 @@ async def export_draft_results(format: str = "json"):
 
     picks.sort(key=lambda p: p["price"], reverse=True)
 
-    my_team_aliases = [a.strip().lower() for a in settings.my_team_name.split(",")]
-    my_picks = [p for p in picks if p["team"].lower() in my_team_aliases]
+    my_picks = [p for p in picks if p["team"].lower() in settings.my_team_aliases]
     export = {
         "draft_date": datetime.now().isoformat(),
         "league_size": settings.league_size,
@@ -708,63 +743,72 @@ def _auto_save_historical(export: dict):
     with open(filepath, "w", encoding="utf-8") as f:
         json.dump(export, f, indent=2, default=str)
 
-    print(f"[Export] Draft results saved to {filepath}")
+    log.info("[Export] Draft results saved to %s", filepath)
 
 
 @app.get("/optimize")
-async def optimize():
+async def optimize(request: Request):
     """Optimal remaining picks given current budget and needs."""
     from roster_optimizer import get_optimal_plan
-    state = DraftState()
+    state = request.app.state.draft_state
     return get_optimal_plan(state)
 
 
 @app.get("/draft-plan")
-async def get_draft_plan():
+async def get_draft_plan(request: Request):
     """On-demand AI draft plan with strategic spending analysis."""
-    state = DraftState()
+    state = request.app.state.draft_state
     return await draft_plan.get_ai_draft_plan(state)
 
 
 @app.get("/dashboard/state")
-async def dashboard_state():
-    """Full state snapshot for the web dashboard."""
-    state = DraftState()
-    return _get_dashboard_snapshot(state)
+async def dashboard_state(request: Request):
+    """Full state snapshot for the web dashboard.
+
+    Serialized directly (same encoding as the WebSocket broadcast) instead of
+    returning the dict, which would make FastAPI walk it with jsonable_encoder
+    before json-encoding it again."""
+    state = request.app.state.draft_state
+    snapshot = _get_dashboard_snapshot(state, request.app.state.ticker)
+    return Response(content=_dumps_compact(snapshot), media_type="application/json")
 
 
 @app.get("/state")
-async def get_state():
+async def get_state(request: Request):
     """View the current draft state summary."""
-    state = DraftState()
+    state = request.app.state.draft_state
     return state.get_state_summary()
 
 
+_ROOT_ENDPOINTS = {
+    "POST /draft_update": "Receives draft data from the extension",
+    "POST /manual": "Manual override (sold, budget, undo, nom, suggest, whatif)",
+    "GET /advice?player=<name>": "Get AI-enhanced advice for a specific player",
+    "GET /health": "Heartbeat / uptime check",
+    "GET /state": "View current draft state summary",
+    "GET /opponents": "Opponent positional needs",
+    "GET /sleepers": "End-of-draft bargain targets",
+    "GET /nominate": "Nomination strategy suggestions",
+    "GET /whatif?player=<name>&price=<int>": "What-if draft simulation",
+    "GET /grade": "Post-draft team grade",
+    "GET /stream/{player}?bid={bid}": "SSE streaming AI advice",
+    "GET /export?format=json|csv": "Export draft results as JSON or CSV",
+    "GET /draft-plan": "On-demand AI draft plan with spending analysis",
+    "GET /dashboard/state": "Full dashboard state snapshot",
+    "WS /ws": "WebSocket for real-time updates",
+}
+
+
 @app.get("/")
 async def root():
+    # Settings fields are read per request — my_team_name can change at runtime
     return {
         "status": "running",
         "message": "Fantasy Auction Assistant backend is live.",
         "my_team": settings.my_team_name,
         "league_size": settings.league_size,
         "budget": settings.budget,
-        "endpoints": {
-            "POST /draft_update": "Receives draft data from the extension",
-            "POST /manual": "Manual override (sold, budget, undo, nom, suggest, whatif)",
-            "GET /advice?player=<name>": "Get AI-enhanced advice for a specific player",
-            "GET /health": "Heartbeat / uptime check",
-            "GET /state": "View current draft state summary",
-            "GET /opponents": "Opponent positional needs",
-            "GET /sleepers": "End-of-draft bargain targets",
-            "GET /nominate": "Nomination strategy suggestions",
-            "GET /whatif?player=<name>&price=<int>": "What-if draft simulation",
-            "GET /grade": "Post-draft team grade",
-            "GET /stream/{player}?bid={bid}": "SSE streaming AI advice",
-            "GET /export?format=json|csv": "Export draft results as JSON or CSV",
-            "GET /draft-plan": "On-demand AI draft plan with spending analysis",
-            "GET /dashboard/state": "Full dashboard state snapshot",
-            "WS /ws": "WebSocket for real-time updates",
-        },
+        "endpoints": _ROOT_ENDPOINTS,
     }
 
 
@@ -777,86 +821,159 @@ async def websocket_endpoint(ws: WebSocket):
     State changes arrive through the HTTP POST /draft_update endpoint.
     """
     await ws.accept()
-    ws_clients.append(ws)
+    ws_clients.add(ws)
     try:
         while True:
             # Keep the connection alive; incoming messages are ignored.
             await ws.receive_text()
     except WebSocketDisconnect:
-        if ws in ws_clients:
-            ws_clients.remove(ws)
+        ws_clients.discard(ws)
 
 
 # -----------------------------------------------------------------
 # Helpers
 # -----------------------------------------------------------------
 
+_ADVICE_COLORS = {
+    "BUY": "#00c853",
+    "PASS": "#ff1744",
+    "PRICE_ENFORCE": "#ffab00",
+    "NOMINATE": "#2196f3",
+}
+
+# Overlay HTML, pre-joined once; filled per update with str.format
+_ADVICE_HEAD = (
+    '<b style="color:{color};font-size:15px">{action}</b> — <b>{player_name}</b><br>'
+    'FMV: <b>${a.fmv}</b> &nbsp;|&nbsp; Bid up to: <b style="color:{color}">${a.max_bid}</b><br>'
+    'Inflation: {a.inflation_rate:.2f}x &nbsp;|&nbsp; Scarcity: {a.scarcity_multiplier:.2f}x &nbsp;|&nbsp; VORP: {a.vorp:.1f} &nbsp;|&nbsp; VONA: {a.vona:.1f}<br>'
+)
+_ADVICE_TAIL = '<span style="font-size:11px;color:#aaa;margin-top:4px;display:block">{a.reasoning}</span>'
+_ADVICE_TEMPLATE = _ADVICE_HEAD + _ADVICE_TAIL
+_ADVICE_TEMPLATE_WITH_NEXT = (
+    _ADVICE_HEAD
+    + '<span style="font-size:11px;color:#8899aa">Next at pos: {a.vona_next_player}</span><br>'
+    + _ADVICE_TAIL
+)
+
+
 def _format_advice_html(player_name: str, current_bid: float, advice) -> str:
     """Format advice as color-coded HTML for the extension overlay."""
-    color_map = {
-        "BUY": "#00c853",
-        "PASS": "#ff1744",
-        "PRICE_ENFORCE": "#ffab00",
-        "NOMINATE": "#2196f3",
-    }
     action = advice.action.value if hasattr(advice.action, "value") else advice.action
-    color = color_map.get(action, "#e0e0e0")
+    template = _ADVICE_TEMPLATE_WITH_NEXT if advice.vona_next_player else _ADVICE_TEMPLATE
+    return template.format(
+        color=_ADVICE_COLORS.get(action, "#e0e0e0"),
+        action=action,
+        player_name=player_name,
+        a=advice,
+    )
 
-    lines = [
-        f'<b style="color:{color};font-size:15px">{action}</b> — <b>{player_name}</b>',
-        f'FMV: <b>${advice.fmv}</b> &nbsp;|&nbsp; Bid up to: <b style="color:{color}">${advice.max_bid}</b>',
-        f'Inflation: {advice.inflation_rate:.2f}x &nbsp;|&nbsp; Scarcity: {advice.scarcity_multiplier:.2f}x &nbsp;|&nbsp; VORP: {advice.vorp:.1f} &nbsp;|&nbsp; VONA: {advice.vona:.1f}',
-        f'<span style="font-size:11px;color:#aaa;margin-top:4px;display:block">{advice.reasoning}</span>',
-    ]
-    if advice.vona_next_player:
-        lines.insert(3, f'<span style="font-size:11px;color:#8899aa">Next at pos: {advice.vona_next_player}</span>')
-    return "<br>".join(lines)
+
+async def _event_writer_loop(event_store: EventStore, queue: asyncio.Queue, state: DraftState):
+    """Drain queued (event_type, payload) tuples into the event log.
+
+    Waits for one event, then grabs whatever else is already queued (up to
+    _EVENT_BATCH_MAX) so a burst of updates costs a single write + flush.
+    Every EventStore.SNAPSHOT_INTERVAL events a state snapshot is written so
+    startup only replays the tail of the log."""
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < _EVENT_BATCH_MAX:
+            try:
+                batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        try:
+            event_store.append_batch(batch)
+            # Endpoints apply events to state before queueing them, so state
+            # matches the log only once the queue has been drained.
+            if queue.empty() and event_store.needs_snapshot():
+                event_store.write_snapshot(state.to_snapshot())
+        except Exception as e:
+            log.warning("  Event log write failed (%s events): %s", len(batch), e)
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+
+def _spawn_precompute(app: FastAPI, player_name: str, current_bid: float, state: DraftState):
+    """Start a background precompute_advice task, gated by app.state.ai_semaphore.
+
+    Tasks are held in app.state.ai_tasks until done so they can't be
+    garbage-collected mid-flight."""
+    async def _guarded():
+        async with app.state.ai_semaphore:
+            await precompute_advice(player_name, current_bid, state)
+
+    task = asyncio.create_task(_guarded())
+    app.state.ai_tasks.add(task)
+    task.add_done_callback(app.state.ai_tasks.discard)
+
+
+def _dumps_compact(message: dict) -> str:
+    """JSON-encode with compact separators: snapshots are large and whitespace is pure overhead."""
+    return json.dumps(message, default=str, separators=(",", ":"))
 
 
 async def _broadcast_ws(message: dict):
-    """Send a message to all connected WebSocket clients."""
+    """Send a message to all connected WebSocket clients.
+
+    The message is serialized once and the same text frame is sent to every
+    client, rather than letting send_json re-encode it per connection.
+    Sends run concurrently in batches, yielding to the event loop between
+    batches so a large fanout doesn't stall other requests."""
+    payload = _dumps_compact(message)
+    clients = list(ws_clients)
     disconnected = []
-    for ws in ws_clients:
-        try:
-            await ws.send_json(message)
-        except Exception:
-            disconnected.append(ws)
+    for i in range(0, len(clients), _WS_BROADCAST_BATCH):
+        batch = clients[i:i + _WS_BROADCAST_BATCH]
+        results = await asyncio.gather(
+            *(ws.send_text(payload) for ws in batch),
+            return_exceptions=True,
+        )
+        disconnected.extend(ws for ws, r in zip(batch, results) if isinstance(r, Exception))
+        if i + _WS_BROADCAST_BATCH < len(clients):
+            await asyncio.sleep(0)
     for ws in disconnected:
-        ws_clients.remove(ws)
+        ws_clients.discard(ws)
 
 
-def _build_player_list(state: DraftState) -> list[dict]:
-    """Build the list of all players with FMV, VORP, VONA, tier, and draft status."""
-    from engine import calculate_fmv
+def _build_fmv_map(state: DraftState) -> dict[int, float]:
+    """FMV for every player keyed by id(PlayerState), shared by the section builders."""
+    from engine import calculate_fmv_batch
 
-    players = []
-    for key, ps in state.players.items():
-        players.append({
+    all_players = list(state.players.values())
+    return dict(zip(map(id, all_players), calculate_fmv_batch(all_players, state)))
+
+
+def _build_player_list(state: DraftState, fmvs: dict[int, float]) -> list[dict]:
+    """Build the list of all players with FMV, VORP, VONA, tier, and draft status."""
+    apply_alias = state.apply_alias
+    return [
+        {
             "name": ps.projection.player_name,
             "position": ps.projection.position.value,
             "tier": ps.projection.tier,
             "projected_points": ps.projection.projected_points,
             "baseline_aav": ps.projection.baseline_aav,
-            "fmv": round(calculate_fmv(ps, state), 1),
+            "fmv": fmvs[id(ps)],
             "vorp": round(ps.vorp, 1),
             "is_drafted": ps.is_drafted,
             "is_keeper": ps.is_keeper,
             "draft_price": ps.draft_price,
-            "drafted_by": state.apply_alias(ps.drafted_by_team),
+            "drafted_by": apply_alias(ps.drafted_by_team),
             "adp_value": ps.adp_value,
             "vona": round(ps.vona, 1),
             "vona_next_player": ps.vona_next_player,
-        })
-    return players
+        }
+        for ps in state.players.values()
+    ]
 
 
-def _build_top_remaining(state: DraftState) -> dict[str, list[dict]]:
+def _build_top_remaining(state: DraftState, fmvs: dict[int, float]) -> dict[str, list[dict]]:
     """Build the top 5 undrafted players per position with tier-break flags."""
-    from engine import calculate_fmv
-
     top_remaining = {}
     for pos in settings.display_positions:
-        remaining = state.get_remaining_players(pos)[:5]
+        remaining = state.get_remaining_players(pos, top_n=5)
         entries = []
         for i, p in enumerate(remaining):
             drop_off = None
@@ -864,7 +981,7 @@ def _build_top_remaining(state: DraftState) -> dict[str, list[dict]]:
                 drop_off = round(p.projection.projected_points - remaining[i + 1].projection.projected_points, 1)
             entries.append({
                 "name": p.projection.player_name,
-                "fmv": round(calculate_fmv(p, state), 1),
+                "fmv": fmvs[id(p)],
                 "vorp": round(p.vorp, 1),
                 "pts_per_game": round(p.projection.projected_points / settings.season_games, 1),
                 "drop_off": drop_off,
@@ -878,9 +995,9 @@ def _build_top_remaining(state: DraftState) -> dict[str, list[dict]]:
     return top_remaining
 
 
-def _build_ticker_events(state: DraftState) -> list[dict]:
+def _build_ticker_events(state: DraftState, ticker: TickerBuffer) -> list[dict]:
     """Get recent ticker events with team aliases applied."""
-    ticker_events = TickerBuffer().get_recent(20)
+    ticker_events = ticker.get_recent(20)
     for evt in ticker_events:
         if evt.get("team_name"):
             evt["team_name"] = state.apply_alias(evt["team_name"])
@@ -973,14 +1090,12 @@ def _build_opponent_needs(state: DraftState) -> dict:
     return opponent_needs
 
 
-def _build_vom_leaderboard(state: DraftState) -> list[dict]:
+def _build_vom_leaderboard(state: DraftState, fmvs: dict[int, float]) -> list[dict]:
     """Build the Value Over Market leaderboard for all drafted players, sorted by VOM."""
-    from engine import calculate_fmv
-
     vom_leaderboard = []
     for ps in state.players.values():
         if ps.is_drafted and ps.draft_price is not None:
-            fmv = calculate_fmv(ps, state)
+            fmv = fmvs[id(ps)]
             vom = round(fmv - ps.draft_price, 1)
             par_dollar = round(ps.vorp / ps.draft_price, 2) if ps.draft_price > 0 else None
             vom_leaderboard.append({
@@ -996,10 +1111,8 @@ def _build_vom_leaderboard(state: DraftState) -> list[dict]:
     return vom_leaderboard
 
 
-def _build_positional_prices(state: DraftState) -> dict[str, dict]:
+def _build_positional_prices(state: DraftState, fmvs: dict[int, float]) -> dict[str, dict]:
     """Compute actual price vs FMV percentage per position for all drafted players."""
-    from engine import calculate_fmv
-
     pos_price_data: dict[str, dict] = {}
     for ps in state.players.values():
         if ps.is_drafted and ps.draft_price is not None:
@@ -1007,7 +1120,7 @@ def _build_positional_prices(state: DraftState) -> dict[str, dict]:
             if pos not in pos_price_data:
                 pos_price_data[pos] = {"total_paid": 0, "total_fmv": 0, "count": 0}
             pos_price_data[pos]["total_paid"] += ps.draft_price
-            pos_price_data[pos]["total_fmv"] += calculate_fmv(ps, state)
+            pos_price_data[pos]["total_fmv"] += fmvs[id(ps)]
             pos_price_data[pos]["count"] += 1
     positional_prices = {}
     for pos in settings.display_positions:
@@ -1021,43 +1134,40 @@ def _build_positional_prices(state: DraftState) -> dict[str, dict]:
 
 
 def _build_positional_run(state: DraftState, positional_prices: dict[str, dict]) -> Optional[dict]:
-    """Detect positional runs: 3+ consecutive same-position sales in the recent draft log."""
-    from engine import calculate_fmv
+    """Detect positional runs: 3+ consecutive same-position sales in the recent draft log.
 
+    Relies on the position and fmv_snapshot (FMV when the sale was logged)
+    fields DraftState attaches to each draft_log entry, so no player lookups
+    happen here."""
     if len(state.draft_log) < 3:
         return None
 
     # Walk backwards through draft log to find runs
     run_pos = None
-    run_count = 0
-    run_above_fmv = 0
+    run: list[dict] = []
     for entry in reversed(state.draft_log[-6:]):
-        name = entry.get("playerName", "")
-        ps = state.get_player(name)
-        if not ps:
+        pos = entry.get("position")
+        if pos is None:
             break
-        pos = ps.projection.position.value
-        price = entry.get("bidAmount", 0)
         if run_pos is None:
             run_pos = pos
-            run_count = 1
-            if price > calculate_fmv(ps, state):
-                run_above_fmv = 1
-        elif pos == run_pos:
-            run_count += 1
-            if price > calculate_fmv(ps, state):
-                run_above_fmv += 1
-        else:
+        elif pos != run_pos:
             break
-    if run_count >= 3:
-        avg_pct = positional_prices.get(run_pos, {}).get("pct_of_fmv", 100)
-        return {
-            "position": run_pos,
-            "consecutive": run_count,
-            "above_fmv_count": run_above_fmv,
-            "avg_pct_of_fmv": avg_pct,
-        }
-    return None
+        run.append(entry)
+    if len(run) < 3:
+        return None
+
+    run_above_fmv = sum(
+        1 for entry in run
+        if entry.get("bidAmount", 0) > entry.get("fmv_snapshot", 0)
+    )
+    avg_pct = positional_prices.get(run_pos, {}).get("pct_of_fmv", 100)
+    return {
+        "position": run_pos,
+        "consecutive": len(run),
+        "above_fmv_count": run_above_fmv,
+        "avg_pct_of_fmv": avg_pct,
+    }
 
 
 def _build_money_velocity(state: DraftState) -> dict:
@@ -1102,32 +1212,51 @@ def _build_budgets(state: DraftState) -> dict[str, int]:
     return state.get_aliased_budgets()
 
 
-def _get_dashboard_snapshot(state: DraftState) -> dict:
+def _get_dashboard_snapshot(state: DraftState, ticker: TickerBuffer) -> dict:
     """Build a comprehensive state snapshot for the web dashboard.
 
     Orchestrates sub-functions that each compute one section of the snapshot,
-    then assembles and returns the final dict.
+    then assembles and returns the final dict. Sections derived purely from
+    draft state are cached per state version (see _get_state_sections); the
+    ticker, current advice, AI status and plan staleness are always rebuilt.
     """
+    snapshot = dict(_get_state_sections(state))
+    snapshot["ticker_events"] = _build_ticker_events(state, ticker)
+    snapshot["current_advice"] = _build_current_advice(state)
+    snapshot["ai_status"] = _ai_advisor_mod.ai_status
+    snapshot["draft_plan_staleness"] = draft_plan.get_picks_since_plan(state)
+    return snapshot
+
+
+def _get_state_sections(state: DraftState) -> dict:
+    """Snapshot sections that only change when draft state does.
+
+    Recomputed when state.version moves (every aggregate recompute), when the
+    draft strategy changes, or when the player news database is refreshed."""
     from sleeper_watch import get_sleeper_candidates
     from nomination import get_nomination_suggestions
     from engine import get_positional_vona_summary
     from roster_optimizer import get_optimal_plan
 
-    players = _build_player_list(state)
-    top_remaining = _build_top_remaining(state)
-    ticker_events = _build_ticker_events(state)
-    current_advice = _build_current_advice(state)
+    cache_key = (state.version, settings.draft_strategy, player_news._last_fetch)
+    cached = state.derived_cache.get("dashboard_sections")
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
+
+    fmvs = _build_fmv_map(state)
+    players = _build_player_list(state, fmvs)
+    top_remaining = _build_top_remaining(state, fmvs)
     opponent_needs = _build_opponent_needs(state)
     player_news_map = player_news.get_news_for_undrafted(state)
-    vom_leaderboard = _build_vom_leaderboard(state)
+    vom_leaderboard = _build_vom_leaderboard(state, fmvs)
     optimizer = get_optimal_plan(state)
-    positional_prices = _build_positional_prices(state)
+    positional_prices = _build_positional_prices(state, fmvs)
     positional_run = _build_positional_run(state, positional_prices)
     money_velocity = _build_money_velocity(state)
     my_team_data = _build_my_team_data(state)
     budgets = _build_budgets(state)
 
-    return {
+    sections = {
         "players": players,
         "my_team": my_team_data,
         "budgets": budgets,
@@ -1140,10 +1269,6 @@ def _get_dashboard_snapshot(state: DraftState) -> dict:
         "nominations": get_nomination_suggestions(state),
         "opponent_needs": opponent_needs,
         "top_remaining": top_remaining,
-        "ticker_events": ticker_events,
-
-        "current_advice": current_advice,
-        "ai_status": _ai_advisor_mod.ai_status,
         "sport": settings.sport,
         "positions": settings.positions,
         "display_positions": settings.display_positions,
@@ -1155,7 +1280,6 @@ def _get_dashboard_snapshot(state: DraftState) -> dict:
         "positional_run": positional_run,
         "money_velocity": money_velocity,
         "player_news": player_news_map,
-        "draft_plan_staleness": draft_plan.get_picks_since_plan(state),
         "strategy": settings.draft_strategy,
         "strategy_label": settings.active_strategy["label"],
         "strategies": {
@@ -1167,6 +1291,8 @@ def _get_dashboard_snapshot(state: DraftState) -> dict:
             list(settings.available_sheets.keys())[0] if settings.available_sheets else None
         ),
     }
+    state.derived_cache["dashboard_sections"] = (cache_key, sections)
+    return sections
 
 
 def _build_engine_grade(state: DraftState) -> dict:
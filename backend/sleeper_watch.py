@@ -4,12 +4,14 @@ as team budgets deplete. Maintained as a live "sleeper watch" list.
 """
 
 from __future__ import annotations
+
+import heapq
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from state import DraftState
 
-from engine import calculate_fmv
+from engine import calculate_fmv_batch
 from config import settings
 
 
@@ -22,7 +24,23 @@ def get_sleeper_candidates(state: "DraftState", max_results: int = 10) -> list[d
     2. Most teams are budget-constrained
     3. Their FMV is in the moderate range ($3-25)
     """
-    remaining = state.get_remaining_players()
+    # Scores depend only on player values, inflation and team budgets, all of
+    # which bump state.version — polls between draft events reuse the result.
+    cache_key = (state.version, settings.league_size, max_results)
+    cached = state.derived_cache.get("sleepers")
+    if cached is None or cached[0] != cache_key:
+        cached = (cache_key, _score_candidates(state, max_results))
+        state.derived_cache["sleepers"] = cached
+    return cached[1]
+
+
+def _score_candidates(state: "DraftState", max_results: int) -> list[dict]:
+    """Top sleeper candidates, sorted by sleeper score descending.
+
+    Every candidate is scored with plain arithmetic; result dicts and
+    reasoning strings are only built for the ones that are returned."""
+    remaining = [ps for ps in state.get_remaining_players() if ps.vorp > 0]
+    fmvs = calculate_fmv_batch(remaining, state)
 
     # Count budget-constrained teams (effective spending power <= $5)
     constrained_teams = 0
@@ -36,13 +54,8 @@ def get_sleeper_candidates(state: "DraftState", max_results: int = 10) -> list[d
         total_teams = settings.league_size
     constraint_ratio = constrained_teams / total_teams
 
-    candidates = []
-    for ps in remaining:
-        if ps.vorp <= 0:
-            continue
-
-        fmv = calculate_fmv(ps, state)
-
+    scored = []
+    for ps, fmv in zip(remaining, fmvs):
         # Skip players too cheap (kickers/DEF) or too expensive (elite)
         if fmv < 1 or fmv > 30:
             continue
@@ -53,7 +66,13 @@ def get_sleeper_candidates(state: "DraftState", max_results: int = 10) -> list[d
             + constraint_ratio * 20
             + (1 - fmv / 30) * 10
         )
+        scored.append((round(sleeper_score, 1), ps, fmv))
+
+    # Partial top-N selection; same order as a stable descending sort
+    top = heapq.nlargest(max_results, scored, key=lambda c: c[0])
 
+    candidates = []
+    for sleeper_score, ps, fmv in top:
         # Estimate what they'll actually go for
         estimated_price = max(1, min(5, int(fmv * (1 - constraint_ratio * 0.7))))
 
@@ -78,9 +97,7 @@ def get_sleeper_candidates(state: "DraftState", max_results: int = 10) -> list[d
             "fmv": round(fmv, 1),
             "tier": ps.projection.tier,
             "estimated_price": estimated_price,
-            "sleeper_score": round(sleeper_score, 1),
+            "sleeper_score": sleeper_score,
             "reasoning": reasoning,
         })
-
-    candidates.sort(key=lambda c: c["sleeper_score"], reverse=True)
-    return candidates[:max_results]
+    return candidates
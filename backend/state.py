@@ -4,9 +4,12 @@ Loads player projections from CSV, tracks draft progress, computes aggregates.
 """
 
 import csv
+import heapq
 import time
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 from models import (
     PlayerProjection,
@@ -21,6 +24,17 @@ from config import settings
 from fuzzy_match import NameResolver, normalize_name
 from opponent_model import OpponentTracker
 
+# Inflation chart history: record a point only when the factor moves by more
+# than this, or after this many seconds; keep at most this many points.
+INFLATION_HISTORY_MIN_DELTA = 0.002
+INFLATION_HISTORY_MAX_GAP = 30.0
+INFLATION_HISTORY_MAX_POINTS = 600
+
+
+def _draft_log_key(team_id, player_id, player_name) -> tuple:
+    """Identity of a draft log entry: the team plus the player's ID (or name)."""
+    return (str(team_id), str(player_id) if player_id is not None else player_name)
+
 
 class DraftState:
     """Singleton managing all draft state in memory."""
@@ -57,17 +71,30 @@ class DraftState:
         self.replacement_level: dict[str, float] = {}
         self.replacement_player: dict[str, str] = {}  # pos -> player name at baseline rank
 
+        # Players per position sorted by VORP desc (rebuilt whenever VORPs change)
+        self._players_by_pos: dict[str, list[PlayerState]] = {}
+        self._indexed_count: int = 0
+
         # Aggregates (recomputed on each update)
         self.total_remaining_aav: float = 0.0
         self.total_remaining_cash: float = 0.0
         self.inflation_factor: float = 1.0
+        self.drafted_count: int = 0
+
+        # name -> (cache key, value) for views derived from state (keyed on version)
+        self.derived_cache: dict[str, tuple] = {}
 
         # Draft log from extension
         self.draft_log: list[dict] = []
+        # (teamId, playerId or name) of every entry already in draft_log
+        self._draft_log_seen: set[tuple] = set()
 
         # Raw latest update for debugging / /state endpoint
         self.raw_latest: dict = {}
 
+        # (lowercased player name, current bid) of the live nomination, if any
+        self.current_nomination: Optional[tuple[str, float]] = None
+
         # Inflation over time for charting (list of [timestamp, factor])
         self.inflation_history: list[list[float]] = []
 
@@ -89,6 +116,9 @@ class DraftState:
         # Active projection sheet label
         self.active_sheet: Optional[str] = None
 
+        # Bumped on every aggregate recompute; keys caches of derived data
+        self.version: int = 0
+
     def resolve_sport(self, detected_sport: Optional[str]):
         """Resolve sport from extension auto-detection if config is 'auto'."""
         if self.resolved_sport not in ("auto", ""):
@@ -132,11 +162,81 @@ class DraftState:
         self.my_team.roster = {slot: None for slot in settings.parsed_roster_slots}
         self.my_team.players_acquired.clear()
         self.draft_log.clear()
+        self._draft_log_seen.clear()
         self.raw_latest.clear()
+        self.current_nomination = None
         self.inflation_history.clear()
         self.newly_drafted.clear()
         self._recompute_aggregates()
 
+    # -----------------------------------------------------------------
+    # Snapshots (for event-log recovery)
+    # -----------------------------------------------------------------
+
+    def to_snapshot(self) -> dict:
+        """JSON-serializable draft progress. Projections are not included —
+        they are reloaded from CSV and the snapshot is applied on top."""
+        tracker = self.opponent_tracker
+        return {
+            "drafted": {
+                key: {
+                    "draft_price": ps.draft_price,
+                    "drafted_by_team": ps.drafted_by_team,
+                    "is_keeper": ps.is_keeper,
+                }
+                for key, ps in self.players.items()
+                if ps.is_drafted
+            },
+            "team_budgets": self.team_budgets,
+            "my_team": self.my_team.model_dump(),
+            "draft_log": self.draft_log,
+            "raw_latest": self.raw_latest,
+            "inflation_history": self.inflation_history,
+            "resolved_sport": self.resolved_sport,
+            "opponents": {
+                "team_rosters": tracker.team_rosters,
+                "team_budgets": tracker.team_budgets,
+                "team_sizes": tracker.team_sizes,
+                "team_names": tracker.team_names,
+            },
+        }
+
+    def restore_snapshot(self, snapshot: dict):
+        """Apply a to_snapshot() dict on top of freshly loaded projections."""
+        # Re-apply an auto-detected sport's profile to settings before the
+        # saved roster is restored under its slot config
+        snap_sport = snapshot.get("resolved_sport")
+        if snap_sport and snap_sport != self.resolved_sport:
+            self.resolve_sport(snap_sport)
+        drafted = snapshot.get("drafted", {})
+        for key, ps in self.players.items():
+            info = drafted.get(key)
+            ps.is_drafted = info is not None
+            ps.draft_price = info["draft_price"] if info else None
+            ps.drafted_by_team = info["drafted_by_team"] if info else None
+            ps.is_keeper = info.get("is_keeper", False) if info else False
+        self.team_budgets = dict(snapshot.get("team_budgets", {}))
+        if snapshot.get("my_team"):
+            self.my_team = MyTeamState(**snapshot["my_team"])
+        self.draft_log = list(snapshot.get("draft_log", []))
+        self._draft_log_seen = {
+            _draft_log_key(e.get("teamId"), e.get("playerId"), e.get("playerName"))
+            for e in self.draft_log
+        }
+        self.raw_latest = dict(snapshot.get("raw_latest", {}))
+        nom = self.raw_latest.get("currentNomination")
+        self.current_nomination = (
+            (nom.get("playerName", "").lower(), self.raw_latest.get("currentBid") or 0)
+            if isinstance(nom, dict) else None
+        )
+        self.inflation_history = [list(p) for p in snapshot.get("inflation_history", [])]
+        opponents = snapshot.get("opponents", {})
+        self.opponent_tracker.team_rosters = dict(opponents.get("team_rosters", {}))
+        self.opponent_tracker.team_budgets = dict(opponents.get("team_budgets", {}))
+        self.opponent_tracker.team_sizes = dict(opponents.get("team_sizes", {}))
+        self.opponent_tracker.team_names = dict(opponents.get("team_names", {}))
+        self._recompute_aggregates()
+
     # -----------------------------------------------------------------
     # CSV Loading
     # -----------------------------------------------------------------
@@ -147,11 +247,9 @@ class DraftState:
         if not path.exists():
             raise FileNotFoundError(f"CSV not found: {csv_path}")
 
+        # Stream rows straight from the reader — no intermediate list of dicts
         with open(path, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-
-        self._load_rows(rows)
+            self._load_rows(csv.DictReader(f))
         self.active_sheet = path.stem
 
     def load_from_merged(self, rows: list[dict]):
@@ -190,7 +288,7 @@ class DraftState:
         # Recompute everything
         self._recompute_aggregates()
 
-    def _load_rows(self, rows: list[dict]):
+    def _load_rows(self, rows: Iterable[dict]):
         """Shared loader for CSV rows or merged dicts."""
         for row in rows:
             proj = PlayerProjection(
@@ -234,13 +332,16 @@ class DraftState:
                 (ps.projection.projected_points, ps.projection.player_name)
             )
 
-        for pos, entries in by_position.items():
-            entries.sort(reverse=True, key=lambda x: x[0])
-            baseline_rank = settings.vorp_baselines.get(pos, 1)
-            idx = min(baseline_rank - 1, len(entries) - 1)
+        vorp_baselines = settings.vorp_baselines  # property — builds a dict per access
+        for pos, group in by_position.items():
+            baseline_rank = vorp_baselines.get(pos, 1)
+            idx = min(baseline_rank - 1, len(group) - 1)
             # Smooth: average ranks N-1, N, N+1
             lo = max(0, idx - 1)
-            hi = min(len(entries) - 1, idx + 1)
+            hi = min(len(group) - 1, idx + 1)
+            # Only the top hi+1 ranks matter: partial selection instead of a full sort
+            n = hi + 1 if idx >= 0 else len(group)
+            entries = heapq.nlargest(n, group, key=lambda x: x[0])
             smooth_pts = sum(entries[i][0] for i in range(lo, hi + 1)) / (hi - lo + 1)
             self.replacement_level[pos] = round(smooth_pts, 2)
             self.replacement_player[pos] = entries[idx][1]
@@ -251,19 +352,42 @@ class DraftState:
             pos = ps.projection.position.value
             replacement = self.replacement_level.get(pos, 0.0)
             ps.vorp = max(0.0, ps.projection.projected_points - replacement)
+        self._build_position_index()
+
+    def _build_position_index(self):
+        """Group players by position, each list sorted by VORP descending."""
+        by_pos: dict[str, list[PlayerState]] = {}
+        for ps in self.players.values():
+            by_pos.setdefault(ps.projection.position.value, []).append(ps)
+        for group in by_pos.values():
+            group.sort(key=lambda ps: ps.vorp, reverse=True)
+        self._players_by_pos = by_pos
+        self._indexed_count = len(self.players)
+
+    def _position_index(self) -> dict[str, list[PlayerState]]:
+        """The per-position index, rebuilt if players were added outside a load."""
+        if self._indexed_count != len(self.players):
+            self._build_position_index()
+        return self._players_by_pos
 
     # -----------------------------------------------------------------
     # Aggregate Recomputation
     # -----------------------------------------------------------------
 
-    def _recompute_aggregates(self):
-        """Recompute total remaining AAV, total remaining cash, and inflation."""
-        remaining_aav = sum(
-            ps.projection.baseline_aav
-            for ps in self.players.values()
-            if not ps.is_drafted
-        )
+    def _recompute_aggregates(self, dirty_positions: Optional[set[str]] = None):
+        """Recompute total remaining AAV, drafted count, total remaining cash, and inflation.
+
+        dirty_positions limits the VONA refresh to positions whose draft
+        status changed; None (the default) refreshes every position."""
+        remaining_aav = 0
+        drafted = 0
+        for ps in self.players.values():
+            if ps.is_drafted:
+                drafted += 1
+            else:
+                remaining_aav += ps.projection.baseline_aav
         self.total_remaining_aav = remaining_aav
+        self.drafted_count = drafted
 
         # Total remaining cash from tracked team budgets, or full league if no data yet
         if self.team_budgets:
@@ -276,32 +400,72 @@ class DraftState:
         else:
             self.inflation_factor = 1.0
 
-        # Track inflation over time (for dashboard charts)
-        self.inflation_history.append([time.time(), self.inflation_factor])
-
-        # Precompute VONA for all undrafted players
-        self._compute_vonas()
+        self.version += 1
 
-    def _compute_vonas(self):
-        """Precompute Value Over Next Available for every player."""
-        from engine import calculate_vona
-        for ps in self.players.values():
-            if not ps.is_drafted:
-                ps.vona, ps.vona_next_player = calculate_vona(ps, self)
-            else:
-                ps.vona = 0.0
-                ps.vona_next_player = None
+        # Track inflation over time (for dashboard charts)
+        self._record_inflation()
+
+        # Precompute VONA for undrafted players
+        self._compute_vonas(dirty_positions)
+
+    def _record_inflation(self):
+        """Append to inflation_history if the factor moved or the last point is stale."""
+        now = time.time()
+        history = self.inflation_history
+        if history:
+            last_t, last_factor = history[-1]
+            if (
+                abs(self.inflation_factor - last_factor) <= INFLATION_HISTORY_MIN_DELTA
+                and now - last_t <= INFLATION_HISTORY_MAX_GAP
+            ):
+                return
+        history.append([now, self.inflation_factor])
+        if len(history) > INFLATION_HISTORY_MAX_POINTS:
+            del history[:len(history) - INFLATION_HISTORY_MAX_POINTS]
+
+    def _compute_vonas(self, positions: Optional[set[str]] = None):
+        """Precompute Value Over Next Available for every player.
+
+        Same result as engine.calculate_vona per player, but each position's
+        VORP-sorted remaining list is walked once — the next available player
+        is simply the following entry — rather than re-scanned per player."""
+        for pos, group in self._position_index().items():
+            if positions is not None and pos not in positions:
+                continue
+            remaining = []
+            for ps in group:
+                if ps.is_drafted:
+                    ps.vona = 0.0
+                    ps.vona_next_player = None
+                else:
+                    remaining.append(ps)
+            for ps, nxt in zip(remaining, remaining[1:]):
+                vona = ps.projection.projected_points - nxt.projection.projected_points
+                ps.vona = round(max(0.0, vona), 1)
+                ps.vona_next_player = nxt.projection.player_name
+            if remaining:
+                # Last at position — VONA equals their VORP (no next alternative)
+                last = remaining[-1]
+                last.vona = round(max(0.0, last.vorp), 1)
+                last.vona_next_player = None
 
     # -----------------------------------------------------------------
     # Draft Event Processing
     # -----------------------------------------------------------------
 
     def update_from_draft_event(self, data: DraftUpdate):
-        """Process an incoming extension update. Idempotent."""
-        self.raw_latest = data.model_dump()
-
-        # Snapshot currently drafted keys so we can detect new sales
-        previously_drafted = {k for k, ps in self.players.items() if ps.is_drafted}
+        """Process an incoming extension update. Idempotent.
+
+        Aggregates (and state.version) are only recomputed when the update
+        changes something they depend on — repeated bid ticks leave
+        version-keyed caches intact."""
+        previous_raw = self.raw_latest
+        # The draft log is kept incrementally in self.draft_log below
+        self.raw_latest = data.model_dump(exclude={"draftLog"})
+        self.current_nomination = (
+            (data.currentNomination.playerName.lower(), data.currentBid or 0)
+            if data.currentNomination else None
+        )
 
         # Update team budgets — key by teamId to avoid duplicate entries
         # when team names resolve later (e.g. Sleeper "Team 3" → "tonytran")
@@ -312,11 +476,23 @@ class DraftState:
                 name = str(team.teamId) if team.teamId else None
             if name and team.remainingBudget is not None:
                 new_budgets[name] = team.remainingBudget
-        if new_budgets:
-            # Replace wholesale — the extension always sends the full team list
-            self.team_budgets = new_budgets
+        budgets_changed = bool(new_budgets) and new_budgets != self.team_budgets
+        if budgets_changed:
+            if new_budgets.keys() == self.team_budgets.keys():
+                self.team_budgets.update(new_budgets)
+            else:
+                # Team membership changed — the extension always sends the full team list
+                self.team_budgets = new_budgets
+
+        # A shorter log than we hold means the platform rewound the draft
+        log_rewound = len(data.draftLog) < len(self.draft_log)
+        if log_rewound:
+            self.draft_log = []
+            self._draft_log_seen.clear()
 
         # Mark newly drafted players from the draft log
+        new_entries: list[tuple[DraftLogEntry, Optional[PlayerState]]] = []
+        newly_drafted: list[PlayerState] = []
         for entry in data.draftLog:
             # Try exact match first, then fuzzy match
             name_key = self._normalize_name(entry.playerName)
@@ -324,11 +500,16 @@ class DraftState:
                 resolved = self.name_resolver.resolve(entry.playerName)
                 if resolved:
                     name_key = resolved
+            key = _draft_log_key(entry.teamId, entry.playerId, entry.playerName)
+            if key not in self._draft_log_seen:
+                self._draft_log_seen.add(key)
+                new_entries.append((entry, self.players.get(name_key)))
             if name_key in self.players and not self.players[name_key].is_drafted:
                 self.players[name_key].is_drafted = True
                 self.players[name_key].draft_price = entry.bidAmount
                 team_name = self._resolve_team_name(entry.teamId, data.teams)
                 self.players[name_key].drafted_by_team = team_name
+                newly_drafted.append(self.players[name_key])
 
                 # Track if this is my team's pick
                 if team_name and self._is_my_team(team_name):
@@ -337,17 +518,31 @@ class DraftState:
         # Update my team's budget from the teams list
         for team in data.teams:
             if self._is_my_team(team.name):
-                if team.remainingBudget is not None:
+                if team.remainingBudget is not None and team.remainingBudget != self.my_team.budget:
                     self.my_team.budget = team.remainingBudget
+                    budgets_changed = True
 
-        self.draft_log = [e.model_dump() for e in data.draftLog]
-        self._recompute_aggregates()
+        if newly_drafted or budgets_changed or new_entries or log_rewound:
+            # Only positions that just lost a player can have a new next-available
+            self._recompute_aggregates(
+                dirty_positions={ps.projection.position.value for ps in newly_drafted}
+            )
 
-        # Detect newly drafted players for ticker
-        self.newly_drafted = [
-            ps for k, ps in self.players.items()
-            if ps.is_drafted and k not in previously_drafted
-        ]
+            # Only new entries are dumped, tagged with position + FMV at the
+            # time of sale so run detection can scan the log without lookups
+            from engine import calculate_fmv
+            for entry, ps in new_entries:
+                logged = entry.model_dump()
+                if ps is not None:
+                    logged["position"] = ps.projection.position.value
+                    logged["fmv_snapshot"] = calculate_fmv(ps, self)
+                self.draft_log.append(logged)
+        elif self.raw_latest["rosters"] != previous_raw.get("rosters"):
+            # Opponent rosters feed version-keyed views but not the aggregates
+            self.version += 1
+
+        # Newly drafted players for ticker, in draft-log order
+        self.newly_drafted = newly_drafted
 
         # Update opponent model
         if data.rosters and data.teams:
@@ -362,12 +557,8 @@ class DraftState:
     def _is_my_team(self, name: Optional[str]) -> bool:
         if not name:
             return False
-        name_lower = name.lower().strip()
         # MY_TEAM_NAME can be comma-separated for aliases (e.g. "Tony's Talented Team,tonytran")
-        for alias in settings.my_team_name.split(","):
-            if alias.strip().lower() == name_lower:
-                return True
-        return False
+        return name.lower().strip() in settings.my_team_aliases
 
     @staticmethod
     def _resolve_team_name(
@@ -391,25 +582,18 @@ class DraftState:
         if not open_slots:
             return  # No room (shouldn't happen if engine is working)
 
-        # Priority 1: Dedicated position slot (exact match)
+        # Priority: dedicated slot (exact match) > first non-BENCH flex > BENCH
         best_slot = None
+        first_flex = None
         for slot in open_slots:
-            base_type = self.my_team.slot_types.get(slot, slot.rstrip("0123456789"))
+            base_type = self.my_team.slot_base(slot)
             if base_type == pos:
                 best_slot = slot
                 break
-
-        # Priority 2: First non-BENCH flex slot
+            if first_flex is None and base_type != "BENCH":
+                first_flex = slot
         if best_slot is None:
-            for slot in open_slots:
-                base_type = self.my_team.slot_types.get(slot, slot.rstrip("0123456789"))
-                if base_type != "BENCH":
-                    best_slot = slot
-                    break
-
-        # Priority 3: BENCH (last resort)
-        if best_slot is None:
-            best_slot = open_slots[0]
+            best_slot = first_flex if first_flex is not None else open_slots[0]
 
         self.my_team.roster[best_slot] = entry.playerName
         self.my_team.players_acquired.append(
@@ -426,16 +610,26 @@ class DraftState:
     # -----------------------------------------------------------------
 
     def get_remaining_players(
-        self, position: Optional[str] = None
+        self, position: Optional[str] = None, top_n: Optional[int] = None
     ) -> list[PlayerState]:
-        """Return undrafted players sorted by VORP, optionally filtered by position."""
-        results = [ps for ps in self.players.values() if not ps.is_drafted]
+        """Return undrafted players sorted by VORP, optionally filtered by position.
+        With top_n, only the best top_n are returned (and only those are selected)."""
         if position:
-            results = [
-                ps for ps in results if ps.projection.position.value == position
-            ]
+            # Pre-sorted per-position list: only this position's players are scanned
+            undrafted = (
+                ps for ps in self._position_index().get(position, ())
+                if not ps.is_drafted
+            )
+            return list(islice(undrafted, top_n))
+        results = [ps for ps in self.players.values() if not ps.is_drafted]
+        if top_n is not None:
+            return heapq.nlargest(top_n, results, key=attrgetter("vorp"))
         return sorted(results, key=lambda ps: ps.vorp, reverse=True)
 
+    def get_position_players(self, position: str) -> list[PlayerState]:
+        """All players (drafted or not) at a position, sorted by VORP descending."""
+        return self._position_index().get(position, [])
+
     def get_player(self, name: str) -> Optional[PlayerState]:
         # Try exact normalized match first (fast path)
         key = self._normalize_name(name)
@@ -475,12 +669,23 @@ class DraftState:
         return {self.apply_alias(k): v for k, v in self.team_budgets.items()}
 
     def get_state_summary(self) -> dict:
-        """JSON-serializable summary for the /state endpoint."""
-        drafted_count = sum(1 for ps in self.players.values() if ps.is_drafted)
+        """JSON-serializable summary for the /state endpoint.
+
+        Memoized per state.version (and roster config): repeat polls between
+        draft events get the same dict back, so callers must not mutate it."""
+        cache_key = (self.version, settings.roster_slots)
+        cached = self.derived_cache.get("summary")
+        if cached is None or cached[0] != cache_key:
+            cached = (cache_key, self._build_state_summary())
+            self.derived_cache["summary"] = cached
+        return cached[1]
+
+    def _build_state_summary(self) -> dict:
+        """Uncached body of get_state_summary."""
         return {
             "total_players": len(self.players),
-            "drafted": drafted_count,
-            "remaining": len(self.players) - drafted_count,
+            "drafted": self.drafted_count,
+            "remaining": len(self.players) - self.drafted_count,
             "inflation_factor": round(self.inflation_factor, 3),
             "total_remaining_cash": self.total_remaining_cash,
             "total_remaining_aav": round(self.total_remaining_aav, 1),
@@ -87,6 +87,13 @@ class TestSlotBaseType:
         assert sbt["QB2"] == "QB"
         assert sbt["SUPERFLEX"] == "SUPERFLEX"
 
+    def test_slot_base_type_follows_roster_change(self):
+        s = Settings(_env_file=None)
+        s.slot_base_type["QB"] = "edited"
+        assert s.slot_base_type["QB"] == "QB"
+        s.roster_slots = "PG,SG,UTIL,UTIL"
+        assert s.slot_base_type == {"PG": "PG", "SG": "SG", "UTIL1": "UTIL", "UTIL2": "UTIL"}
+
 
 class TestSportProfiles:
     def test_football_profile_exists(self):
@@ -207,3 +214,15 @@ class TestSlotMap:
         assert sm[0] == "QB"
         assert sm[2] == "RB"
         assert sm[20] == "BENCH"
+
+
+class TestMyTeamAliases:
+    def test_aliases_lowercased_and_stripped(self):
+        s = Settings(_env_file=None, my_team_name="Tony's Team, TonyTran")
+        assert s.my_team_aliases == frozenset({"tony's team", "tonytran"})
+
+    def test_aliases_follow_runtime_edits(self):
+        s = Settings(_env_file=None, my_team_name="Alpha")
+        assert "beta" not in s.my_team_aliases
+        s.my_team_name = "Alpha,Beta"
+        assert "beta" in s.my_team_aliases
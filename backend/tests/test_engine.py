@@ -12,6 +12,7 @@ from models import (
 from engine import (
     calculate_vorp,
     calculate_fmv,
+    calculate_fmv_batch,
     calculate_vona,
     calculate_scarcity_multiplier,
     calculate_need_multiplier,
@@ -89,6 +90,12 @@ class TestCalculateFmv:
         fmv = calculate_fmv(ps, draft_state)
         assert fmv == 0.0
 
+    def test_fmv_batch_matches_single(self, draft_state):
+        players = list(draft_state.players.values())
+        assert calculate_fmv_batch(players, draft_state) == [
+            calculate_fmv(ps, draft_state) for ps in players
+        ]
+
 
 # =====================================================================
 # calculate_vona
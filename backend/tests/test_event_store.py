@@ -81,6 +81,22 @@ class TestEventStoreAppend:
         assert json.loads(lines[1])["seq"] == 2
         assert json.loads(lines[2])["seq"] == 3
 
+    def test_append_batch_writes_all_events(self, tmp_path):
+        store = EventStore()
+        path = str(tmp_path / "test_events.jsonl")
+        store.open(path)
+
+        store.append("event1", {"data": 1})
+        store.append_batch([("event2", {"data": 2}), ("event3", {"data": 3})])
+
+        store.close()
+
+        with open(path, "r") as f:
+            records = [json.loads(line) for line in f]
+        assert [r["seq"] for r in records] == [1, 2, 3]
+        assert [r["type"] for r in records] == ["event1", "event2", "event3"]
+        assert records[2]["payload"] == {"data": 3}
+
     def test_append_without_open_is_noop(self, tmp_path):
         """Appending without calling open() should silently do nothing."""
         store = EventStore()
@@ -190,6 +206,20 @@ class TestEventStoreReplay:
         assert store._seq == 2
         store.close()
 
+    def test_open_sequence_skips_torn_tail(self, tmp_path, monkeypatch):
+        """A partial last line (crash mid-write) is ignored, across read blocks."""
+        monkeypatch.setattr(EventStore, "TAIL_CHUNK", 16)
+        path = tmp_path / "test_events.jsonl"
+        with open(path, "w") as f:
+            for i in range(1, 6):
+                f.write(json.dumps({"seq": i, "type": "good", "payload": {"pad": "x" * 20}}) + "\n")
+            f.write('{"seq": 6, "type": "go')
+
+        store = EventStore()
+        store.open(str(path))
+        assert store._seq == 5
+        store.close()
+
 
 class TestEventStoreClear:
     def test_clear_removes_file_contents(self, tmp_path):
@@ -236,6 +266,54 @@ class TestEventStoreClear:
         store.close()
 
 
+class TestEventStoreSnapshot:
+    def test_snapshot_roundtrip(self, tmp_path):
+        store = EventStore()
+        store.open(str(tmp_path / "test_events.jsonl"))
+        store.append("e1", {})
+        store.append("e2", {})
+        store.write_snapshot({"budget": 150})
+        store.append("e3", {})
+
+        record = store.load_snapshot()
+        assert record["seq"] == 2
+        assert record["state"] == {"budget": 150}
+        tail = store.replay(after_seq=record["seq"])
+        assert [e["seq"] for e in tail] == [3]
+        store.close()
+
+    def test_needs_snapshot_after_interval(self, tmp_path):
+        store = EventStore()
+        store.open(str(tmp_path / "test_events.jsonl"))
+        store.append_batch([("e", {})] * (EventStore.SNAPSHOT_INTERVAL - 1))
+        assert not store.needs_snapshot()
+        store.append("e", {})
+        assert store.needs_snapshot()
+        store.write_snapshot({})
+        assert not store.needs_snapshot()
+        store.close()
+
+    def test_load_snapshot_ahead_of_log_is_ignored(self, tmp_path):
+        path = tmp_path / "test_events.jsonl"
+        (tmp_path / "test_events.snapshot.json").write_text(
+            json.dumps({"seq": 10, "ts": 0, "state": {}})
+        )
+        store = EventStore()
+        store.open(str(path))
+        assert store.load_snapshot() is None
+        store.close()
+
+    def test_clear_removes_snapshot(self, tmp_path):
+        store = EventStore()
+        store.open(str(tmp_path / "test_events.jsonl"))
+        store.append("e1", {})
+        store.write_snapshot({})
+        store.clear()
+        assert not (tmp_path / "test_events.snapshot.json").exists()
+        assert store.load_snapshot() is None
+        store.close()
+
+
 class TestEventStoreClose:
     def test_close_clears_file_handle(self, tmp_path):
         store = EventStore()
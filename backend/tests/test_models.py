@@ -330,6 +330,22 @@ class TestMyTeamState:
         team.roster["BENCH1"] = "Some Player"
         assert team.bench_spots_remaining == 1
 
+    def test_remove_player_clears_slot_and_acquired(self, team):
+        team.roster["RB1"] = "Bijan Robinson"
+        team.roster["QB"] = "Josh Allen"
+        team.players_acquired = [
+            {"name": "Bijan Robinson", "price": 55},
+            {"name": "Josh Allen", "price": 30},
+        ]
+        team.remove_player("bijan robinson")
+        assert team.roster["RB1"] is None
+        assert team.roster["QB"] == "Josh Allen"
+        assert [p["name"] for p in team.players_acquired] == ["Josh Allen"]
+
+    def test_slot_base_uses_slot_types_then_strips_digits(self, team):
+        assert team.slot_base("FLEX2") == "FLEX"
+        assert team.slot_base("BENCH3") == "BENCH"
+
 
 # =====================================================================
 # AdviceAction Enum
@@ -127,6 +127,19 @@ class TestFindPlayerWithIndex:
         result = player_news._find_player("Nonexistent Player")
         assert result is None
 
+    def test_index_miss_skips_linear_scan(self, monkeypatch):
+        """With a built index, a miss returns None without iterating the DB."""
+        _load_db({
+            "100": _make_player("100", "Patrick Mahomes", team="KC"),
+        })
+
+        class _NoScan(dict):
+            def items(self):
+                raise AssertionError("linear scan on index miss")
+
+        monkeypatch.setattr(player_news, "_player_db", _NoScan(player_news._player_db))
+        assert player_news._find_player("Nonexistent Player") is None
+
     def test_duplicate_name_resolution(self):
         _load_db({
             "300": _make_player("300", "Mike Williams", active=False, team=None),
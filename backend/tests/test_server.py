@@ -0,0 +1,39 @@
+"""
+Tests for server.py helpers: positional run detection.
+"""
+
+from models import DraftUpdate
+from server import _build_positional_run, _replay_manual_command
+
+
+# =====================================================================
+# Positional Run Detection
+# =====================================================================
+
+class TestPositionalRun:
+    def test_fmv_snapshot_survives_manual_sale(self, draft_state, sample_draft_update):
+        """Run entries are scored against FMV at sale time, not live inflation."""
+        sample_draft_update["draftLog"] = [
+            {"playerId": "1", "playerName": "Patrick Mahomes", "teamId": "1", "bidAmount": 35},
+            {"playerId": "2", "playerName": "Josh Allen", "teamId": "3", "bidAmount": 29},
+            {"playerId": "3", "playerName": "Jalen Hurts", "teamId": "1", "bidAmount": 21},
+        ]
+        draft_state.update_from_draft_event(DraftUpdate(**sample_draft_update))
+
+        run = _build_positional_run(draft_state, {})
+        assert run["position"] == "QB"
+        assert run["consecutive"] == 3
+        assert run["above_fmv_count"] == 2
+
+        # A manual sale raises inflation; the logged run keeps its scoring...
+        _replay_manual_command("Saquon Barkley 60 3", draft_state)
+        assert draft_state.players["saquon barkley"].is_drafted
+
+        run = _build_positional_run(draft_state, {})
+        assert run["above_fmv_count"] == 2
+
+        # ...including after the next extension update
+        sample_draft_update["teams"][0]["remainingBudget"] = 165
+        draft_state.update_from_draft_event(DraftUpdate(**sample_draft_update))
+        run = _build_positional_run(draft_state, {})
+        assert run["above_fmv_count"] == 2
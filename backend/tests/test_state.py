@@ -2,6 +2,8 @@
 Tests for state.py: DraftState CSV loading, draft event processing, queries, and aggregates.
 """
 
+import json
+
 import pytest
 from state import DraftState
 from models import DraftUpdate, Position
@@ -132,6 +134,44 @@ class TestDraftEventProcessing:
         draft_state.update_from_draft_event(du)
         assert len(draft_state.newly_drafted) == 0
 
+    def test_draft_log_entries_tagged(self, draft_state, sample_draft_update):
+        """Draft log entries carry position and FMV for run detection."""
+        du = DraftUpdate(**sample_draft_update)
+        draft_state.update_from_draft_event(du)
+
+        entry = draft_state.draft_log[0]
+        assert entry["position"] == "QB"
+        expected_fmv = round(25.0 * draft_state.inflation_factor, 1)
+        assert entry["fmv_snapshot"] == expected_fmv
+
+    def test_draft_log_appends_only_new_entries(self, draft_state, sample_draft_update):
+        """Entries already logged are kept as-is; only new picks are added."""
+        draft_state.update_from_draft_event(DraftUpdate(**sample_draft_update))
+        first = draft_state.draft_log[0]
+
+        sample_draft_update["draftLog"].append(
+            {"playerId": "222", "playerName": "Josh Allen", "teamId": "3", "bidAmount": 28}
+        )
+        draft_state.update_from_draft_event(DraftUpdate(**sample_draft_update))
+
+        assert len(draft_state.draft_log) == 2
+        assert draft_state.draft_log[0] is first
+        assert draft_state.draft_log[1]["playerName"] == "Josh Allen"
+
+    def test_draft_log_rewound(self, draft_state, sample_draft_update):
+        draft_state.update_from_draft_event(DraftUpdate(**sample_draft_update))
+        sample_draft_update["draftLog"] = []
+        draft_state.update_from_draft_event(DraftUpdate(**sample_draft_update))
+        assert draft_state.draft_log == []
+
+    def test_current_nomination_cached(self, draft_state, sample_draft_update):
+        draft_state.update_from_draft_event(DraftUpdate(**sample_draft_update))
+        assert draft_state.current_nomination == ("patrick mahomes", 30.0)
+
+        del sample_draft_update["currentNomination"]
+        draft_state.update_from_draft_event(DraftUpdate(**sample_draft_update))
+        assert draft_state.current_nomination is None
+
     def test_recompute_after_draft(self, draft_state, sample_draft_update):
         initial_aav = draft_state.total_remaining_aav
         du = DraftUpdate(**sample_draft_update)
@@ -199,6 +239,33 @@ class TestGetRemainingPlayers:
         after = len(draft_state.get_remaining_players())
         assert after == before - 1
 
+    def test_top_n_matches_sliced_full_sort(self, draft_state):
+        draft_state.players["patrick mahomes"].is_drafted = True
+        full = draft_state.get_remaining_players()
+        assert draft_state.get_remaining_players(top_n=5) == full[:5]
+        assert draft_state.get_remaining_players("QB", top_n=2) == draft_state.get_remaining_players("QB")[:2]
+
+    def test_position_filter_matches_full_sort(self, draft_state):
+        """The per-position index yields the same order as filtering the full list."""
+        draft_state.players["patrick mahomes"].is_drafted = True
+        for pos in ("QB", "RB", "WR", "TE", "K", "DEF"):
+            expected = [
+                ps for ps in draft_state.get_remaining_players()
+                if ps.projection.position.value == pos
+            ]
+            assert draft_state.get_remaining_players(pos) == expected
+
+    def test_position_index_picks_up_added_players(self, draft_state):
+        from models import PlayerProjection, PlayerState
+        proj = PlayerProjection(
+            player_name="Extra QB", position=Position.QB,
+            projected_points=1.0, baseline_aav=1.0, tier=9,
+        )
+        draft_state.players["extra qb"] = PlayerState(projection=proj)
+        assert proj.player_name in [
+            ps.projection.player_name for ps in draft_state.get_position_players("QB")
+        ]
+
 
 class TestStarterNeed:
     def test_initial_starter_needs(self, draft_state):
@@ -247,6 +314,56 @@ class TestRecomputeAggregates:
         # Should default to 1.0 when no AAV remains
         assert draft_state.inflation_factor == 1.0
 
+    def test_drafted_count_tracks_recompute(self, draft_state, sample_draft_update):
+        assert draft_state.drafted_count == 0
+        draft_state.update_from_draft_event(DraftUpdate(**sample_draft_update))
+        assert draft_state.drafted_count == 1
+
+    def test_repeated_event_keeps_version(self, draft_state, sample_draft_update):
+        """A bid tick that changes nothing leaves version and budgets untouched."""
+        draft_state.update_from_draft_event(DraftUpdate(**sample_draft_update))
+        version = draft_state.version
+        budgets = draft_state.team_budgets
+
+        sample_draft_update["currentBid"] = 35.0
+        draft_state.update_from_draft_event(DraftUpdate(**sample_draft_update))
+        assert draft_state.version == version
+
+        sample_draft_update["teams"][0]["remainingBudget"] = 160
+        draft_state.update_from_draft_event(DraftUpdate(**sample_draft_update))
+        assert draft_state.version > version
+        assert draft_state.team_budgets is budgets
+        assert budgets["Team Alpha"] == 160
+
+    def test_draft_event_vonas_match_full_recompute(self, draft_state, sample_draft_update):
+        """Refreshing only dirty positions yields the same VONAs as a full pass."""
+        draft_state.update_from_draft_event(DraftUpdate(**sample_draft_update))
+        partial = {k: (ps.vona, ps.vona_next_player) for k, ps in draft_state.players.items()}
+        draft_state._recompute_aggregates()
+        full = {k: (ps.vona, ps.vona_next_player) for k, ps in draft_state.players.items()}
+        assert partial == full
+
+    def test_inflation_history_skips_flat_points_and_is_capped(self, draft_state, monkeypatch):
+        import state as state_mod
+        before = len(draft_state.inflation_history)
+        draft_state._recompute_aggregates()  # factor unchanged
+        assert len(draft_state.inflation_history) == before
+
+        monkeypatch.setattr(state_mod, "INFLATION_HISTORY_MAX_POINTS", 3)
+        for budget in (100, 90, 80, 70):
+            draft_state.team_budgets = {"Team A": budget}
+            draft_state._recompute_aggregates()
+        assert len(draft_state.inflation_history) == 3
+        assert draft_state.inflation_history[-1][1] == draft_state.inflation_factor
+
+    def test_version_bumps_on_recompute(self, draft_state, sample_draft_update):
+        v0 = draft_state.version
+        draft_state._recompute_aggregates()
+        assert draft_state.version == v0 + 1
+
+        draft_state.update_from_draft_event(DraftUpdate(**sample_draft_update))
+        assert draft_state.version > v0 + 1
+
 
 class TestReset:
     def test_reset_clears_draft_progress(self, draft_state, sample_draft_update):
@@ -276,6 +393,43 @@ class TestReset:
         assert all(v is None for v in draft_state.my_team.roster.values())
 
 
+class TestSnapshot:
+    def test_snapshot_roundtrip(self, draft_state, sample_draft_update):
+        draft_state.update_from_draft_event(DraftUpdate(**sample_draft_update))
+        snapshot = json.loads(json.dumps(draft_state.to_snapshot(), default=str))
+        expected_cash = draft_state.total_remaining_cash
+        expected_log = len(draft_state.draft_log)
+
+        draft_state.reset()
+        draft_state.restore_snapshot(snapshot)
+
+        mahomes = draft_state.players["patrick mahomes"]
+        assert mahomes.is_drafted is True
+        assert mahomes.draft_price == 30
+        assert draft_state.total_remaining_cash == expected_cash
+        assert len(draft_state.draft_log) == expected_log
+
+        # Entries restored from the snapshot are not logged a second time
+        draft_state.update_from_draft_event(DraftUpdate(**sample_draft_update))
+        assert len(draft_state.draft_log) == expected_log
+
+    def test_restore_reapplies_auto_detected_sport(self, draft_state, _test_settings):
+        from config import SPORT_PROFILES
+
+        snapshot = json.loads(json.dumps(draft_state.to_snapshot(), default=str))
+        snapshot["resolved_sport"] = "basketball"
+        _test_settings.sport = "auto"
+        draft_state.resolved_sport = "auto"
+
+        draft_state.restore_snapshot(snapshot)
+
+        profile = SPORT_PROFILES["basketball"]
+        assert draft_state.resolved_sport == "basketball"
+        assert _test_settings.sport == "basketball"
+        assert _test_settings.roster_slots == profile["default_roster_slots"]
+        assert _test_settings.SLOT_ELIGIBILITY == profile["slot_eligibility"]
+
+
 class TestRosterSlotAssignment:
     def test_dedicated_slot_first(self, draft_state):
         """Player should go to dedicated position slot before flex."""
@@ -355,3 +509,12 @@ class TestStateSummary:
         assert summary["total_players"] == 16
         assert summary["drafted"] == 1
         assert summary["remaining"] == 15
+
+    def test_summary_memoized_until_version_changes(self, draft_state, sample_draft_update):
+        first = draft_state.get_state_summary()
+        assert draft_state.get_state_summary() is first
+
+        draft_state.update_from_draft_event(DraftUpdate(**sample_draft_update))
+        updated = draft_state.get_state_summary()
+        assert updated is not first
+        assert updated["drafted"] == 1
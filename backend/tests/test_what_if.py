@@ -20,6 +20,13 @@ class TestCloneState:
         cloned.players["patrick mahomes"].is_drafted = True
         assert draft_state.players["patrick mahomes"].is_drafted is False
 
+    def test_clone_shares_projections_only(self, draft_state):
+        cloned = clone_state(draft_state)
+        original = draft_state.players["patrick mahomes"]
+        copied = cloned.players["patrick mahomes"]
+        assert copied is not original
+        assert copied.projection is original.projection
+
     def test_clone_copies_players(self, draft_state):
         cloned = clone_state(draft_state)
         assert len(cloned.players) == len(draft_state.players)
@@ -129,6 +136,17 @@ class TestSimulateWhatIf:
         if "error" not in result:
             assert result["projected_total_points"] > 0
 
+    def test_candidates_reused_across_prices(self, draft_state):
+        """Trying another price for the same player reuses the scored candidates."""
+        simulate_what_if("Saquon Barkley", 40, draft_state)
+        cached = draft_state.derived_cache["what_if_candidates"]
+        result = simulate_what_if("Saquon Barkley", 60, draft_state)
+        assert draft_state.derived_cache["what_if_candidates"] is cached
+        assert result["remaining_budget_after"] == draft_state.my_team.budget - 60
+
+        simulate_what_if("CeeDee Lamb", 40, draft_state)
+        assert draft_state.derived_cache["what_if_candidates"] is not cached
+
     def test_expensive_purchase_limits_optimal_picks(self, draft_state):
         """Spending most of the budget should leave fewer optimal picks."""
         result_cheap = simulate_what_if("Tyler Bass", 1, draft_state)
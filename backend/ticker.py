@@ -8,7 +8,9 @@ Events are pushed to both the overlay and the web dashboard.
 from __future__ import annotations
 
 import time
+from collections import deque
 from enum import Enum
+from itertools import islice
 from typing import Optional, TYPE_CHECKING
 
 from pydantic import BaseModel
@@ -50,9 +52,14 @@ class TickerBuffer:
         if self._initialized:
             return
         self._initialized = True
-        self.events: list[TickerEvent] = []
+        self.events: deque[TickerEvent] = deque(maxlen=self.MAX_EVENTS)
+        # model_dump() of each event, parallel to self.events (events are
+        # never modified after push, so each is serialized exactly once)
+        self._dumps: deque[dict] = deque(maxlen=self.MAX_EVENTS)
         self._last_nomination: Optional[str] = None
         self._last_bid: Optional[tuple] = None
+        # (nominee, bid, high bidder) of the last update, to skip no-op ticks
+        self._last_signature: Optional[tuple] = None
 
     @classmethod
     def _reset_for_testing(cls):
@@ -60,29 +67,43 @@ class TickerBuffer:
         cls._instance = None
 
     def push(self, event: TickerEvent):
-        """Append an event, evict oldest if buffer is full."""
+        """Append an event; the deque evicts the oldest once full."""
         self.events.append(event)
-        if len(self.events) > self.MAX_EVENTS:
-            self.events = self.events[-self.MAX_EVENTS:]
+        self._dumps.append(event.model_dump())
+
+    def push_many(self, events: list[TickerEvent]):
+        """Append several events at once."""
+        self.events.extend(events)
+        self._dumps.extend(e.model_dump() for e in events)
 
     def get_recent(self, n: int = 20) -> list[dict]:
-        """Return the most recent N events as dicts, oldest first (chat order)."""
-        return [e.model_dump() for e in self.events[-n:]]
+        """Return the most recent N events as dicts, oldest first (chat order).
+        Each dict is a fresh shallow copy, so callers may edit top-level fields."""
+        start = max(0, len(self._dumps) - n)
+        return [dict(d) for d in islice(self._dumps, start, None)]
 
     def process_update(self, data: "DraftUpdate"):
         """
         Detect new nominations and bid changes from an incoming DraftUpdate.
         Called from /draft_update before sale processing.
         """
+        nomination = data.currentNomination
+        nom_name = nomination.playerName if nomination else None
+        amount = data.currentBid
+        high_bidder = data.highBidder
+        signature = (nom_name, amount, high_bidder)
+        if signature == self._last_signature:
+            return  # Same nominee, bid and bidder: nothing new to report
+        self._last_signature = signature
+
         now = time.time()
 
         # Detect new nomination
-        if data.currentNomination:
-            nom_name = data.currentNomination.playerName
+        if nomination:
             if nom_name and nom_name != self._last_nomination:
                 self._last_nomination = nom_name
                 self._last_bid = None
-                team_label = _resolve_team(data.currentNomination.nominatingTeamId, data.teams)
+                team_label = _resolve_team(nomination.nominatingTeamId, data.teams)
                 self.push(TickerEvent(
                     event_type=TickerEventType.NEW_NOMINATION,
                     timestamp=now,
@@ -92,23 +113,17 @@ class TickerBuffer:
                 ))
 
         # Detect bid changes
-        if data.currentNomination and data.currentBid is not None:
-            bid_key = (
-                data.currentNomination.playerName,
-                data.currentBid,
-                str(data.highBidder) if data.highBidder else None,
-            )
+        if nomination and amount is not None:
+            bidder_str = str(high_bidder) if high_bidder else None
+            bid_key = (nom_name, amount, bidder_str)
             if bid_key != self._last_bid:
                 self._last_bid = bid_key
-                bidder = str(data.highBidder) if data.highBidder else "Unknown"
-                player_name = data.currentNomination.playerName
-                amount = data.currentBid
-
+                bidder = bidder_str or "Unknown"
                 self.push(TickerEvent(
                     event_type=TickerEventType.BID_PLACED,
                     timestamp=now,
-                    message=f"{bidder} bid ${int(amount)} on {player_name}",
-                    player_name=player_name,
+                    message=f"{bidder} bid ${int(amount)} on {nom_name}",
+                    player_name=nom_name,
                     team_name=bidder,
                     amount=amount,
                 ))
@@ -1,42 +1,78 @@
 """
 What-If simulation — "What if I spend $X on PlayerY?"
 
-Creates a deep copy of draft state, simulates the purchase,
+Creates an independent copy of draft state, simulates the purchase,
 then greedily fills remaining roster by best VORP/$ ratio.
 """
 
-import copy
 from typing import Optional
 
 from state import DraftState
+from opponent_model import OpponentTracker
 from engine import calculate_fmv, calculate_strategy_multiplier
 from config import settings
 
 
 def clone_state(state: DraftState) -> DraftState:
-    """Create a deep copy of DraftState bypassing the singleton."""
+    """Create an independent copy of DraftState bypassing the singleton."""
     clone = object.__new__(DraftState)
     clone._initialized = True
-    clone.players = copy.deepcopy(state.players)
-    clone.team_budgets = copy.deepcopy(state.team_budgets)
-    clone.my_team = state.my_team.model_copy(deep=True)
+    # Simulations only touch PlayerState's draft fields, so each player is a
+    # shallow copy that shares the (never mutated) projection with the source
+    clone.players = {key: ps.model_copy() for key, ps in state.players.items()}
+    clone.team_budgets = dict(state.team_budgets)
+    # The simulated purchase only rebinds budget and adds to the roster and
+    # acquired list, so copying those containers is enough to isolate them
+    my_team = state.my_team
+    clone.my_team = my_team.model_copy(update={
+        "roster": dict(my_team.roster),
+        "players_acquired": list(my_team.players_acquired),
+        "slot_types": dict(my_team.slot_types),
+    })
     clone.replacement_level = dict(state.replacement_level)
+    clone._build_position_index()
     clone.total_remaining_aav = state.total_remaining_aav
     clone.total_remaining_cash = state.total_remaining_cash
     clone.inflation_factor = state.inflation_factor
+    clone.drafted_count = state.drafted_count
+    clone.derived_cache = {}
     clone.draft_log = list(state.draft_log)
+    clone._draft_log_seen = set(state._draft_log_seen)
     clone.raw_latest = dict(state.raw_latest)
+    clone.current_nomination = state.current_nomination
     clone.inflation_history = list(state.inflation_history)
     clone.name_resolver = state.name_resolver  # Share (read-only)
     clone.newly_drafted = []
     clone.team_aliases = dict(state.team_aliases)
     clone.resolved_sport = state.resolved_sport
+    clone.version = state.version
     # Give it a dummy opponent_tracker
-    from opponent_model import OpponentTracker
     clone.opponent_tracker = OpponentTracker()
     return clone
 
 
+def _score_candidates(sim: DraftState) -> tuple[list[tuple], dict[str, int]]:
+    """Price and score every remaining player of a simulated state, in VORP order.
+
+    Returns (name, position, pick cost, value ratio, vorp, projected points)
+    tuples and the cheapest pick cost per position. Prices and ratios don't
+    change while filling (inflation is fixed until the next recompute).
+    """
+    candidates = []
+    min_cost_by_pos: dict[str, int] = {}
+    for ps in sim.get_remaining_players():
+        p_pos = ps.projection.position.value
+        pick_cost = max(1, int(calculate_fmv(ps, sim) * 0.8))
+        ratio = (ps.vorp * calculate_strategy_multiplier(ps, sim)) / pick_cost
+        candidates.append((
+            ps.projection.player_name, p_pos, pick_cost, ratio,
+            ps.vorp, ps.projection.projected_points,
+        ))
+        if pick_cost < min_cost_by_pos.get(p_pos, pick_cost + 1):
+            min_cost_by_pos[p_pos] = pick_cost
+    return candidates, min_cost_by_pos
+
+
 def simulate_what_if(player_name: str, price: int, state: DraftState) -> dict:
     """
     Simulate purchasing a player and show optimal remaining draft.
@@ -75,77 +111,88 @@ def simulate_what_if(player_name: str, price: int, state: DraftState) -> dict:
     if open_slots:
         best_slot = None
         for slot in open_slots:
-            base_type = sim.my_team.slot_types.get(slot, slot.rstrip("0123456789"))
+            base_type = sim.my_team.slot_base(slot)
             if base_type == pos:
                 best_slot = slot
                 break
         if best_slot is None:
             for slot in open_slots:
-                base_type = sim.my_team.slot_types.get(slot, slot.rstrip("0123456789"))
+                base_type = sim.my_team.slot_base(slot)
                 if base_type != "BENCH":
                     best_slot = slot
                     break
         if best_slot is None:
             best_slot = open_slots[0]
         sim.my_team.roster[best_slot] = actual_name
-        sim.my_team.players_acquired.append({"name": actual_name, "position": pos, "price": price})
+        sim.my_team.players_acquired.append({
+            "name": actual_name,
+            "position": pos,
+            "price": price,
+            "projected_points": sim_player.projection.projected_points,
+        })
 
     sim._recompute_aggregates()
 
     # Greedy optimal fill of remaining starter slots (bench fills at $1)
     optimal_picks = []
+    optimal_points = 0.0
     remaining_budget = sim.my_team.budget - sim.my_team.bench_spots_remaining  # reserve $1/bench
     needs = sim.get_starter_need()
 
+    # Candidate prices and ratios depend only on the state version, the
+    # strategy and which player was bought (not the price), so exploring
+    # several prices for the same player reuses one scoring pass
+    cache_key = (state.version, settings.draft_strategy, actual_name)
+    cached = state.derived_cache.get("what_if_candidates")
+    if cached is None or cached[0] != cache_key:
+        cached = (cache_key, _score_candidates(sim))
+        state.derived_cache["what_if_candidates"] = cached
+    candidates, min_cost_by_pos = cached[1]
+    taken: set[int] = set()
+
     for _ in range(settings.roster_size):  # Safety bound
-        if remaining_budget <= 0:
-            break
-        if not any(v > 0 for v in needs.values()):
+        # Stop without scanning once nothing at a still-needed position is affordable
+        needed_costs = [
+            min_cost_by_pos[pos] for pos, count in needs.items()
+            if count > 0 and pos in min_cost_by_pos
+        ]
+        if not needed_costs or min(needed_costs) > remaining_budget:
             break
 
         best = None
         best_ratio = -1
 
-        for ps in sim.get_remaining_players():
-            p_pos = ps.projection.position.value
-            if needs.get(p_pos, 0) <= 0:
+        for i, (_, p_pos, pick_cost, ratio, _, _) in enumerate(candidates):
+            if i in taken or needs.get(p_pos, 0) <= 0 or pick_cost > remaining_budget:
                 continue
-            fmv = calculate_fmv(ps, sim)
-            pick_cost = max(1, int(fmv * 0.8))
-            if pick_cost > remaining_budget:
-                continue
-            strategy_mult = calculate_strategy_multiplier(ps, sim)
-            ratio = (ps.vorp * strategy_mult) / max(pick_cost, 1)
             if ratio > best_ratio:
                 best_ratio = ratio
-                best = (ps, pick_cost)
+                best = i
 
-        if not best:
+        if best is None:
             break
 
-        ps, pick_cost = best
-        p_pos = ps.projection.position.value
+        name, p_pos, pick_cost, _, vorp, points = candidates[best]
         optimal_picks.append({
-            "player": ps.projection.player_name,
+            "player": name,
             "position": p_pos,
             "estimated_price": pick_cost,
-            "vorp": round(ps.vorp, 1),
+            "vorp": round(vorp, 1),
         })
-        ps.is_drafted = True
+        optimal_points += points
+        taken.add(best)
         remaining_budget -= pick_cost
         needs[p_pos] = needs.get(p_pos, 0) - 1
 
-    # Calculate projected total
-    projected_total = sum(
-        sim.get_player(p["name"]).projection.projected_points
-        for p in sim.my_team.players_acquired
-        if sim.get_player(p["name"])
-    )
-    projected_total += sum(
-        state.get_player(p["player"]).projection.projected_points
-        for p in optimal_picks
-        if state.get_player(p["player"])
-    )
+    # Calculate projected total (live picks carry their points; keepers
+    # and older entries fall back to a lookup)
+    projected_total = optimal_points
+    for p in sim.my_team.players_acquired:
+        points = p.get("projected_points")
+        if points is None:
+            acquired = sim.get_player(p["name"])
+            points = acquired.projection.projected_points if acquired else 0
+        projected_total += points
 
     return {
         "hypothetical_purchase": {"player": actual_name, "price": price},